@@ -102,6 +102,10 @@ class AutomationLogger:
         """Establece nivel mínimo de logging"""
         self.min_level = level
 
+    def is_debug_enabled(self) -> bool:
+        """Indica si el nivel mínimo actual deja pasar mensajes DEBUG"""
+        return self._should_log(LogLevel.DEBUG)
+
     def debug(self, message: str, context: Optional[Dict] = None):
         """Log de nivel DEBUG"""
         self._log(message, LogLevel.DEBUG, context)
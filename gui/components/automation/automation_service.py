@@ -33,11 +33,12 @@ from .state_config_manager import StateConfigManager
 class AutomationService:
     """Servicio principal con funcionalidad completa de extracción de números de serie y estado configurable expandido"""
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, debug_enabled=None):
         self.is_running = False
         self.target_url = "https://fieldservice.cabletica.com/dispatchFS/"
         self._lock = threading.Lock()
         self.logger = logger
+        self.debug_enabled = debug_enabled
 
         # Estado de última extracción
         self.last_extraction_file = None
@@ -91,7 +92,8 @@ class AutomationService:
                 dropdown_handler=self.dropdown_handler,
                 date_handler=self.date_handler,
                 button_handler=self.button_handler,
-                logger=self._log
+                logger=self._log,
+                debug_enabled=self.debug_enabled
             )
 
             self._log("🔧 Handlers de automatización con números de serie y estado configurable inicializados correctamente")
@@ -307,7 +309,7 @@ class AutomationService:
         """Detiene todas las operaciones de automatización"""
         with self._lock:
             self._log("🛑 Deteniendo todas las operaciones...")
-            cleanup_success, cleanup_message = self.automation_orchestrator.cleanup_automation()
+            cleanup_success, cleanup_message = self.automation_orchestrator.cleanup_automation(keep_driver=False)
             self.is_running = False
 
             if cleanup_success:
@@ -600,8 +602,8 @@ class AutomationService:
             self._log(error_msg, "ERROR")
             return False, error_msg
 
-    def get_automation_status_detailed(self):
-        """🆕 Obtiene estado detallado incluyendo información de números de serie y estado expandido"""
+    def get_automation_status_detailed(self, fields=None):
+        """🆕 Obtiene estado detallado; fields limita los bloques que se consultan al navegador"""
         try:
             if not self.is_running or not self.web_driver_manager.driver:
                 return {
@@ -618,7 +620,7 @@ class AutomationService:
                     'last_used_state': self.last_used_state
                 }
 
-            status = self.automation_orchestrator.get_automation_status(self.web_driver_manager.driver)
+            status = self.automation_orchestrator.get_automation_status(self.web_driver_manager.driver, fields)
             status['automation_running'] = self.is_running
             status['data_extraction_available'] = self.is_data_extraction_available()
             status['serie_extraction_available'] = self.is_serie_extraction_available()  # Cambiado
@@ -8,104 +8,346 @@ de credenciales, configuración de fechas y elementos estilizados para la interf
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-import re
+import importlib.util
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutMetrics:
+    """Medidas de layout compartidas por los componentes de automatización"""
+    header_height: int = 45
+    collapsed_height: int = 55
+    header_padx: int = 15
+    header_pady: int = 12
+    card_padx: int = 18
+    card_pady: int = 15
+    button_padx: int = 20
+    button_pady: int = 12
+    border_thickness: int = 1
+    section_spacing: tuple = (0, 10)
+
+
+METRICS = LayoutMetrics()
+
+# Base de opciones de Tk para las clases de frame Syncro* (se instala una sola vez)
+_OPTION_DB_INSTALLED = False
+
+
+def _install_option_db(widget, theme):
+    """Registra los colores compartidos por clase de frame; las reglas más específicas van al final"""
+    global _OPTION_DB_INSTALLED
+    if _OPTION_DB_INSTALLED:
+        return
+
+    colors = theme.colors
+    widget.option_add('*SyncroCard*background', colors['bg_primary'])
+    widget.option_add('*SyncroCard.highlightBackground', colors['border'])
+    widget.option_add('*SyncroCard.highlightColor', colors['border'])
+    widget.option_add('*SyncroPanel*background', colors['bg_primary'])
+    widget.option_add('*SyncroHeader*background', colors['bg_secondary'])
+    widget.option_add('*SyncroHeader*foreground', colors['text_primary'])
+    widget.option_add('*SyncroRow*background', colors['bg_tertiary'])
+    widget.option_add('*SyncroRow*foreground', colors['text_primary'])
+
+    # Entradas y botones estilizados: bg del botón lo pone cada llamada
+    fonts = _fonts()
+    for container in ('SyncroCard', 'SyncroPanel', 'SyncroForm'):
+        widget.option_add(f'*{container}*Entry.background', colors['bg_tertiary'])
+        widget.option_add(f'*{container}*Entry.foreground', colors['text_primary'])
+        widget.option_add(f'*{container}*Entry.font', fonts['body10'])
+        widget.option_add(f'*{container}*Entry.relief', 'flat')
+        widget.option_add(f'*{container}*Button.foreground', 'white')
+        widget.option_add(f'*{container}*Button.font', fonts['bold10'])
+        widget.option_add(f'*{container}*Button.relief', 'flat')
+        widget.option_add(f'*{container}*Button.padX', METRICS.button_padx)
+        widget.option_add(f'*{container}*Button.padY', METRICS.button_pady)
+        widget.option_add(f'*{container}*Button.cursor', 'hand2')
+    _OPTION_DB_INSTALLED = True
+
+# Resultado del sondeo de Selenium (None hasta que se ejecuta)
+_SELENIUM_AVAILABLE = None
+
+
+def is_selenium_available():
+    """Sondea Selenium con find_spec una sola vez, sin ejecutar su paquete"""
+    global _SELENIUM_AVAILABLE
+    if _SELENIUM_AVAILABLE is None:
+        _SELENIUM_AVAILABLE = importlib.util.find_spec('selenium') is not None
+    return _SELENIUM_AVAILABLE
+
+
+# Textos del indicador de Selenium según disponibilidad: (prefijo, estado, clave de color)
+_SELENIUM_STATUS = {
+    True: ("🤖 Selenium:", "✅ Disponible (Login automático)", 'success'),
+    False: ("⚠️ Selenium:", "❌ No disponible (Solo navegador)", 'warning'),
+}
+
+# Fuentes compartidas (se crean al primer uso, cuando ya existe la ventana raíz)
+_FONTS = None
+
+
+def _fonts():
+    """Obtiene las fuentes compartidas del módulo, creándolas una sola vez"""
+    global _FONTS
+    if _FONTS is None:
+        import tkinter.font as tkfont
+        _FONTS = {
+            'title': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'bold10': tkfont.Font(family='Arial', size=10, weight='bold'),
+            'body10': tkfont.Font(family='Arial', size=10),
+            'bold9': tkfont.Font(family='Arial', size=9, weight='bold'),
+            'body9': tkfont.Font(family='Arial', size=9),
+            'body8': tkfont.Font(family='Arial', size=8),
+            'mono': tkfont.Font(family='Consolas', size=9)
+        }
+    return _FONTS
+
+
+# Formato de fecha de los formularios y texto guía de los campos vacíos
+DATE_FORMAT = "%d/%m/%Y"
+DATE_PLACEHOLDER = "DD/MM/YYYY"
+
+
+def _parse_ddmmyyyy(date_text):
+    """Convierte DD/MM/YYYY a datetime o devuelve None si no es válida"""
+    # Descarte O(1) de textos a medio escribir antes de tocar la caché o strptime
+    if len(date_text) != 10 or date_text[2] != '/' or date_text[5] != '/':
+        return None
+    return _parse_full_date(date_text)
+
+
+@lru_cache(maxsize=256)
+def _parse_full_date(date_text):
+    """Parseo completo con strptime (memoizado)"""
+    try:
+        date = datetime.strptime(date_text, DATE_FORMAT)
+    except ValueError:
+        return None
+    return date if 1900 <= date.year <= 2100 else None
+
+
+_UNSET = object()
+
+
+def _configure_if_changed(cache, widget, **options):
+    """Aplica configure() solo con las opciones que difieren de las últimas escritas en el widget"""
+    written = cache.setdefault(widget, {})
+    changed = {name: value for name, value in options.items() if written.get(name, _UNSET) != value}
+    if changed:
+        written.update(changed)
+        widget.configure(**changed)
+
+
+_THEME_COLORS = MappingProxyType({
+    'bg_primary': '#f0f0f0',
+    'bg_secondary': '#e0e0e0',
+    'bg_tertiary': '#ffffff',
+    'text_primary': '#333333',
+    'text_secondary': '#666666',
+    'border': '#cccccc',
+    'accent': '#0078d4',
+    'success': '#107c10',
+    'warning': '#ff8c00',
+    'error': '#d13438',
+    'info': '#0078d4'
+})
 
 
 class AutomationTheme:
     """Tema de colores específico para automatización"""
 
     def __init__(self):
-        self.colors = {
-            'bg_primary': '#f0f0f0',
-            'bg_secondary': '#e0e0e0',
-            'bg_tertiary': '#ffffff',
-            'text_primary': '#333333',
-            'text_secondary': '#666666',
-            'border': '#cccccc',
-            'accent': '#0078d4',
-            'success': '#107c10',
-            'warning': '#ff8c00',
-            'error': '#d13438',
-            'info': '#0078d4'
-        }
+        self.colors = _THEME_COLORS
+
+
+_DEFAULT_THEME = AutomationTheme()
+
+
+class _WidgetRecord:
+    """Base de los registros de widgets de cada panel"""
+    __slots__ = ()
+
+    def as_dict(self):
+        """Devuelve los widgets como diccionario nombre -> widget"""
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+@dataclass(slots=True)
+class CredentialsWidgets(_WidgetRecord):
+    """Widgets del formulario de credenciales"""
+    username_entry: Optional[tk.Entry] = None
+    password_entry: Optional[tk.Entry] = None
+    show_password_var: Optional[tk.BooleanVar] = None
+    test_credentials_button: Optional[tk.Button] = None
+    save_credentials_button: Optional[tk.Button] = None
+    clear_credentials_button: Optional[tk.Button] = None
+    selenium_status_label: Optional[tk.Label] = None
+
+
+@dataclass(slots=True)
+class DateConfigWidgets(_WidgetRecord):
+    """Widgets del formulario de configuración de fechas"""
+    skip_date_var: Optional[tk.BooleanVar] = None
+    date_from_entry: Optional[tk.Entry] = None
+    date_to_entry: Optional[tk.Entry] = None
+    date_from_validation: Optional[tk.Label] = None
+    date_to_validation: Optional[tk.Label] = None
+    set_today_button: Optional[tk.Button] = None
+    clear_dates_button: Optional[tk.Button] = None
+
+
+@dataclass(slots=True)
+class StatusWidgets(_WidgetRecord):
+    """Widgets del panel de estado"""
+    automation_status: Optional[tk.Label] = None
+    url_status: Optional[tk.Label] = None
+
+
+@dataclass(slots=True)
+class ControlWidgets(_WidgetRecord):
+    """Widgets del panel de controles"""
+    start_button: Optional[tk.Button] = None
+    pause_button: Optional[tk.Button] = None
+
+
+@dataclass(slots=True)
+class LogWidgets(_WidgetRecord):
+    """Widgets del panel de log"""
+    log_text: Optional[scrolledtext.ScrolledText] = None
+    clear_log_button: Optional[tk.Button] = None
+    log_tree: Optional[ttk.Treeview] = None
+
+
+class _ButtonCommands:
+    """Base de los paneles con botones: un despachador por botón que busca el callback por nombre"""
+
+    def _dispatcher(self, button_name):
+        """Comando fijo del botón; el callback real se registra después con set_button_command"""
+        return lambda: self._dispatch(button_name)
+
+    def _dispatch(self, button_name):
+        """Ejecuta el callback registrado para el botón, si lo hay"""
+        command = self._commands.get(button_name)
+        if command is not None:
+            command()
+
+    def set_button_command(self, button_name, command):
+        """Establece comando para un botón específico"""
+        self._commands[button_name] = command
+
+
+def _make_styled_button(parent, text, command, color):
+    """Crea un botón con estilo consistente (fuente, relieve y padding desde la base de opciones)"""
+    return tk.Button(parent, text=text, command=command, bg=color)
+
+
+def build_card(parent, title, theme, *, header_font=None, cursor='', **card_options):
+    """Construye tarjeta + header con título + área de contenido.
+
+    El llamador ubica la tarjeta y el contenido. Devuelve (card, header, title_label, content).
+    """
+    _install_option_db(parent, theme)
+
+    card = tk.Frame(parent, class_='SyncroCard', relief='solid', bd=METRICS.border_thickness,
+                    highlightthickness=METRICS.border_thickness, **card_options)
+    card.grid_columnconfigure(0, weight=1)
+
+    # Header de altura fija
+    header = tk.Frame(card, class_='SyncroHeader', height=METRICS.header_height, cursor=cursor)
+    header.grid(row=0, column=0, sticky='ew')
+    header.grid_propagate(False)
+    header.grid_columnconfigure(0, weight=1)
+
+    header_content = tk.Frame(header)
+    header_content.grid(row=0, column=0, sticky='ew', padx=METRICS.header_padx, pady=METRICS.header_pady)
+    header_content.grid_columnconfigure(0, weight=1)
+
+    title_label = tk.Label(header_content, text=title, font=header_font or _fonts()['title'], cursor=cursor)
+    title_label.grid(row=0, column=0, sticky='w')
+
+    # Content area
+    content = tk.Frame(card)
+
+    return card, header, title_label, content
 
 
 class CollapsibleSection:
     """Componente de sección colapsable tipo acordeón para automatización"""
 
-    def __init__(self, parent, section_id, title, theme=None):
+    # Secciones vivas por id, para expandir/colapsar sin reconstruir
+    _registry = weakref.WeakValueDictionary()
+
+    def __init__(self, parent, section_id, title, theme=None, builder=None):
         self.parent = parent
         self.section_id = section_id
         self.title = title
-        self.theme = theme or AutomationTheme()
+        self.theme = theme or _DEFAULT_THEME
         self.expanded = False
         self.min_height = 150
 
+        # Constructor diferido del contenido (se ejecuta en la primera expansión)
+        self._builder = builder
+
         # Referencias a elementos
         self.container = None
         self.header = None
         self.content_frame = None
         self.arrow_label = None
         self.on_toggle_callback = None
+        self._layout_pending = False
+        self._last_height = None
+        # Estado que refleja el layout aplicado (puede ir por detrás de expanded hasta la pasada idle)
+        self._applied_expanded = False
+        CollapsibleSection._registry[section_id] = self
+
+    def create(self, row, min_height=150, default_expanded=False, builder=None):
+        """Crea la sección colapsable (reutiliza los frames si ya fue creada).
+
+        Si se indica builder, el contenido se construye en la primera expansión.
+        """
+        if self.container is not None:
+            self.show(row)
+            return self.content_frame
 
-    def create(self, row, min_height=150, default_expanded=False):
-        """Crea la sección colapsable"""
         self.min_height = min_height
+        if builder is not None:
+            self._builder = builder
 
-        # Contenedor principal
-        self.container = tk.Frame(self.parent, bg=self.theme.colors['bg_primary'])
-        self.container.configure(height=55)
-        self.container.grid(row=row, column=0, sticky='ew', pady=(0, 10))
-        self.container.grid_columnconfigure(0, weight=1)
+        # Contenedor principal (también es la tarjeta visible)
+        self.container, self.header, title_label, self.content_frame = build_card(
+            self.parent, self.title, self.theme, cursor='hand2', height=METRICS.collapsed_height
+        )
+        self.container.grid(row=row, column=0, sticky='ew', pady=METRICS.section_spacing)
         self.container.grid_propagate(False)
-
-        # Frame de la tarjeta
-        card = tk.Frame(self.container, bg=self.theme.colors['bg_primary'],
-                        relief='solid', bd=1)
-        card.configure(highlightbackground=self.theme.colors['border'],
-                       highlightcolor=self.theme.colors['border'],
-                       highlightthickness=1)
-        card.grid(row=0, column=0, sticky='ew')
-        card.grid_columnconfigure(0, weight=1)
-
-        # Header clickeable
-        self.header = tk.Frame(card, bg=self.theme.colors['bg_secondary'],
-                               height=45, cursor='hand2')
-        self.header.grid(row=0, column=0, sticky='ew')
-        self.header.grid_propagate(False)
-        self.header.grid_columnconfigure(0, weight=1)
-
-        # Contenido del header
-        header_content = tk.Frame(self.header, bg=self.theme.colors['bg_secondary'])
-        header_content.grid(row=0, column=0, sticky='ew', padx=15, pady=12)
-        header_content.grid_columnconfigure(0, weight=1)
-
-        # Título
-        title_label = tk.Label(header_content, text=self.title,
-                               bg=self.theme.colors['bg_secondary'],
-                               fg=self.theme.colors['text_primary'],
-                               font=('Arial', 12, 'bold'), cursor='hand2')
-        title_label.grid(row=0, column=0, sticky='w')
+        self._last_height = METRICS.collapsed_height
 
         # Flecha indicadora
-        self.arrow_label = tk.Label(header_content, text="▶",
-                                    bg=self.theme.colors['bg_secondary'],
+        self.arrow_label = tk.Label(title_label.master, text="▶",
                                     fg=self.theme.colors['accent'],
-                                    font=('Arial', 10, 'bold'), cursor='hand2')
+                                    font=_fonts()['bold10'], cursor='hand2')
         self.arrow_label.grid(row=0, column=1, sticky='e')
 
         # Content area
-        self.content_frame = tk.Frame(card, bg=self.theme.colors['bg_primary'])
         self.content_frame.grid_columnconfigure(0, weight=1)
+        self.content_frame.bind('<Configure>', self._fit_height)
 
         # Estado inicial
         if default_expanded:
             self.content_frame.grid(row=1, column=0, sticky='ew')
             self.arrow_label.configure(text="▼")
             self.expanded = True
-            self.container.configure(height=min_height)
-            self.container.grid_propagate(True)
+            self._set_height(min_height)
+            self._applied_expanded = True
+            self._run_builder()
 
         # Bind eventos
         def toggle_section(event=None):
@@ -118,23 +360,112 @@ class CollapsibleSection:
         return self.content_frame
 
     def toggle(self):
-        """Alterna la visibilidad de la sección"""
-        if self.expanded:
-            self.content_frame.grid_remove()
-            self.arrow_label.configure(text="▶")
-            self.expanded = False
-            self.container.configure(height=55)
-            self.container.grid_propagate(False)
-        else:
-            self.content_frame.grid(row=1, column=0, sticky='ew')
-            self.arrow_label.configure(text="▼")
-            self.expanded = True
-            self.container.configure(height=self.min_height)
-            self.container.grid_propagate(True)
+        """Alterna la visibilidad de la sección (el layout se aplica en idle)"""
+        self._mutate_state()
+        self._schedule_layout()
 
         if self.on_toggle_callback:
             self.on_toggle_callback(self.section_id, self.expanded)
 
+    def _mutate_state(self):
+        """Actualiza estado y flecha sin tocar la geometría"""
+        self.expanded = not self.expanded
+        self.arrow_label.configure(text="▼" if self.expanded else "▶")
+        if self.expanded:
+            self._run_builder()
+
+    def _run_builder(self):
+        """Construye el contenido diferido una sola vez"""
+        if self._builder is not None:
+            builder = self._builder
+            self._builder = None
+            builder(self.content_frame)
+
+    def _schedule_layout(self):
+        """Programa una única aplicación de layout para la próxima pasada idle"""
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.header.after_idle(self._apply_layout)
+
+    def _apply_layout(self):
+        """Aplica grid/altura según el estado actual (nada si toggles seguidos se anularon)"""
+        self._layout_pending = False
+        if self.expanded == self._applied_expanded:
+            return
+
+        self._applied_expanded = self.expanded
+        if self.expanded:
+            self.content_frame.grid(row=1, column=0, sticky='ew')
+            self._fit_height()
+        else:
+            self.content_frame.grid_remove()
+            self._set_height(METRICS.collapsed_height)
+
+    def _set_height(self, height):
+        """Fija la altura del contenedor solo si cambió respecto a la última escrita"""
+        if height != self._last_height:
+            self._last_height = height
+            self.container.configure(height=height)
+
+    def _fit_height(self, event=None):
+        """Ajusta la altura fija del contenedor al contenido expandido (sin propagación de grid)"""
+        if not self.expanded:
+            return
+
+        # Header + contenido + borde y highlight a cada lado
+        needed = (self.header.winfo_reqheight() + self.content_frame.winfo_reqheight()
+                  + 4 * METRICS.border_thickness)
+        self._set_height(max(self.min_height, needed))
+
+    @classmethod
+    def expand_many(cls, sections):
+        """Expande varias secciones con una sola pasada de layout"""
+        cls._toggle_many(sections, expanded=True)
+
+    @classmethod
+    def collapse_many(cls, sections):
+        """Colapsa varias secciones con una sola pasada de layout"""
+        cls._toggle_many(sections, expanded=False)
+
+    @staticmethod
+    def _toggle_many(sections, expanded):
+        """Muta el estado de todas las secciones y agrupa el layout en un solo after_idle"""
+        changed = [section for section in sections if section.expanded != expanded]
+        if not changed:
+            return
+
+        for section in changed:
+            section._mutate_state()
+
+        pending = [section for section in changed if not section._layout_pending]
+        for section in pending:
+            section._layout_pending = True
+
+        def flush():
+            for section in pending:
+                section._apply_layout()
+
+        if pending:
+            pending[0].header.after_idle(flush)
+
+        for section in changed:
+            if section.on_toggle_callback:
+                section.on_toggle_callback(section.section_id, section.expanded)
+
+    def show(self, row):
+        """Vuelve a mostrar la sección ya creada en la fila indicada"""
+        self.container.grid(row=row, column=0, sticky='ew', pady=METRICS.section_spacing)
+
+    def hide(self):
+        """Oculta la sección sin destruir sus widgets"""
+        if self.container is not None:
+            self.container.grid_remove()
+
+    @classmethod
+    def find(cls, section_id):
+        """Obtiene una sección viva por id, o None si ya no existe"""
+        return cls._registry.get(section_id)
+
     def set_toggle_callback(self, callback):
         """Establece callback para eventos de toggle"""
         self.on_toggle_callback = callback
@@ -154,18 +485,64 @@ class CollapsibleSection:
             self.toggle()
 
 
-class CredentialsForm:
+class SectionCache:
+    """Caché de secciones colapsables: oculta y vuelve a mostrar en lugar de destruir y recrear"""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self._cache = {}
+
+    def get(self, section_id):
+        """Obtiene una sección registrada o None"""
+        return self._cache.get(section_id)
+
+    def register(self, section):
+        """Registra una sección en la caché"""
+        self._cache[section.section_id] = section
+        return section
+
+    def get_or_create(self, section_id, title, theme=None, row=0, min_height=150, default_expanded=False,
+                      builder=None):
+        """Obtiene el contenido de una sección, creándola solo la primera vez"""
+        section = self._cache.get(section_id)
+        if section is None:
+            section = self.register(CollapsibleSection(self.parent, section_id, title, theme, builder))
+        return section.create(row, min_height=min_height, default_expanded=default_expanded)
+
+    def hide(self, section_id):
+        """Oculta una sección sin destruirla"""
+        section = self._cache.get(section_id)
+        if section:
+            section.hide()
+
+    def hide_all(self):
+        """Oculta todas las secciones registradas"""
+        for section in self._cache.values():
+            section.hide()
+
+    def clear(self):
+        """Destruye las secciones registradas y vacía la caché"""
+        for section in self._cache.values():
+            if section.container is not None:
+                section.container.destroy()
+        self._cache.clear()
+
+
+class CredentialsForm(_ButtonCommands):
     """Formulario de credenciales con funcionalidades avanzadas"""
 
     def __init__(self, parent, theme=None):
         self.parent = parent
-        self.theme = theme or AutomationTheme()
-        self.widgets = {}
+        self.theme = theme or _DEFAULT_THEME
+        self.widgets = CredentialsWidgets()
+        self._commands = {}
+        self.selenium_prefix_label = None
 
     def create(self):
         """Crea el formulario completo de credenciales"""
-        content = tk.Frame(self.parent, bg=self.theme.colors['bg_primary'])
-        content.pack(fill='x', padx=18, pady=15)
+        _install_option_db(self.parent, self.theme)
+        content = tk.Frame(self.parent, class_='SyncroForm', bg=self.theme.colors['bg_primary'])
+        content.pack(fill='x', padx=METRICS.card_padx, pady=METRICS.card_pady)
 
         # Campo de usuario
         self._create_username_field(content)
@@ -179,162 +556,163 @@ class CredentialsForm:
         # Estado de Selenium
         self._create_selenium_status(content)
 
-        return self.widgets
+        return self.widgets.as_dict()
 
     def _create_username_field(self, parent):
         """Crea el campo de usuario"""
-        tk.Label(parent, text="👤 Usuario:", bg=self.theme.colors['bg_primary'],
-                 fg=self.theme.colors['text_primary'], font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0, 5))
+        colors = self.theme.colors
+        tk.Label(parent, text="👤 Usuario:", bg=colors['bg_primary'],
+                 fg=colors['text_primary'], font=_fonts()['bold10']).pack(anchor='w', pady=(0, 5))
 
-        self.widgets['username_entry'] = self._create_styled_entry(parent)
-        self.widgets['username_entry'].pack(fill='x', pady=(0, 15))
+        self.widgets.username_entry = self._create_styled_entry(parent)
+        self.widgets.username_entry.pack(fill='x', pady=(0, 15))
 
     def _create_password_field(self, parent):
         """Crea el campo de contraseña con toggle de visibilidad"""
-        tk.Label(parent, text="🔒 Contraseña:", bg=self.theme.colors['bg_primary'],
-                 fg=self.theme.colors['text_primary'], font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0, 5))
+        colors = self.theme.colors
+        tk.Label(parent, text="🔒 Contraseña:", bg=colors['bg_primary'],
+                 fg=colors['text_primary'], font=_fonts()['bold10']).pack(anchor='w', pady=(0, 5))
 
-        password_frame = tk.Frame(parent, bg=self.theme.colors['bg_primary'])
+        password_frame = tk.Frame(parent, bg=colors['bg_primary'])
         password_frame.pack(fill='x', pady=(0, 15))
 
-        self.widgets['password_entry'] = self._create_styled_entry(password_frame, show='*')
-        self.widgets['password_entry'].pack(side='left', fill='x', expand=True)
+        self.widgets.password_entry = self._create_styled_entry(password_frame, show='*')
+        self.widgets.password_entry.pack(side='left', fill='x', expand=True)
 
         # Botón mostrar contraseña
-        self.widgets['show_password_var'] = tk.BooleanVar()
+        self.widgets.show_password_var = tk.BooleanVar()
+        self.widgets.show_password_var.trace_add('write', self._on_show_password_changed)
         show_btn = tk.Checkbutton(
-            password_frame, text="👁️", variable=self.widgets['show_password_var'],
-            command=self._toggle_password_visibility,
-            bg=self.theme.colors['bg_primary'], fg=self.theme.colors['text_secondary'],
-            font=('Arial', 10), padx=10
+            password_frame, text="👁️", variable=self.widgets.show_password_var,
+            bg=colors['bg_primary'], fg=colors['text_secondary'],
+            font=_fonts()['body10'], padx=10
         )
         show_btn.pack(side='right')
 
     def _create_action_buttons(self, parent):
         """Crea los botones de acción"""
-        buttons_frame = tk.Frame(parent, bg=self.theme.colors['bg_primary'])
+        colors = self.theme.colors
+        buttons_frame = tk.Frame(parent, bg=colors['bg_primary'])
         buttons_frame.pack(fill='x')
 
-        buttons_frame.grid_columnconfigure(0, weight=1)
-        buttons_frame.grid_columnconfigure(1, weight=1)
-        buttons_frame.grid_columnconfigure(2, weight=1)
+        buttons_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
         # Botón probar credenciales
-        self.widgets['test_credentials_button'] = self._create_styled_button(
-            buttons_frame, "🔍 Probar", None, self.theme.colors['info']
+        self.widgets.test_credentials_button = _make_styled_button(
+            buttons_frame, "🔍 Probar", self._dispatcher('test_credentials_button'), colors['info']
         )
-        self.widgets['test_credentials_button'].grid(row=0, column=0, sticky='ew', padx=(0, 5))
+        self.widgets.test_credentials_button.grid(row=0, column=0, sticky='ew', padx=(0, 5))
 
         # Botón guardar credenciales
-        self.widgets['save_credentials_button'] = self._create_styled_button(
-            buttons_frame, "💾 Guardar", None, self.theme.colors['success']
+        self.widgets.save_credentials_button = _make_styled_button(
+            buttons_frame, "💾 Guardar", self._dispatcher('save_credentials_button'), colors['success']
         )
-        self.widgets['save_credentials_button'].grid(row=0, column=1, sticky='ew', padx=2.5)
+        self.widgets.save_credentials_button.grid(row=0, column=1, sticky='ew', padx=2.5)
 
         # Botón limpiar credenciales
-        self.widgets['clear_credentials_button'] = self._create_styled_button(
-            buttons_frame, "🗑️ Limpiar", None, self.theme.colors['error']
+        self.widgets.clear_credentials_button = _make_styled_button(
+            buttons_frame, "🗑️ Limpiar", self._dispatcher('clear_credentials_button'), colors['error']
         )
-        self.widgets['clear_credentials_button'].grid(row=0, column=2, sticky='ew', padx=(5, 0))
+        self.widgets.clear_credentials_button.grid(row=0, column=2, sticky='ew', padx=(5, 0))
 
     def _create_selenium_status(self, parent):
         """Crea indicador de estado de Selenium"""
-        selenium_status_frame = tk.Frame(parent, bg=self.theme.colors['bg_secondary'])
+        colors = self.theme.colors
+        selenium_status_frame = tk.Frame(parent, bg=colors['bg_secondary'])
         selenium_status_frame.pack(fill='x', pady=(15, 0))
 
-        # Importar aquí para evitar dependencias circulares
-        try:
-            import selenium
-            selenium_available = True
-        except ImportError:
-            selenium_available = False
+        self.selenium_prefix_label = tk.Label(
+            selenium_status_frame, text=_SELENIUM_STATUS[True][0], bg=colors['bg_secondary'],
+            fg=colors['text_primary'], font=_fonts()['body9']
+        )
+        self.selenium_prefix_label.pack(side='left', padx=10, pady=8)
 
-        selenium_text = "🤖 Selenium:" if selenium_available else "⚠️ Selenium:"
-        tk.Label(selenium_status_frame, text=selenium_text, bg=self.theme.colors['bg_secondary'],
-                 fg=self.theme.colors['text_primary'], font=('Arial', 9)).pack(side='left', padx=10, pady=8)
+        # Placeholder neutro; el sondeo corre fuera del hilo de UI tras la primera pasada idle
+        self.widgets.selenium_status_label = tk.Label(
+            selenium_status_frame, text="Comprobando…", bg=colors['bg_secondary'],
+            fg=colors['text_secondary'], font=_fonts()['bold9']
+        )
+        self.widgets.selenium_status_label.pack(side='right', padx=10, pady=8)
 
-        selenium_status = "✅ Disponible (Login automático)" if selenium_available else "❌ No disponible (Solo navegador)"
-        selenium_color = self.theme.colors['success'] if selenium_available else self.theme.colors['warning']
+        selenium_status_frame.after_idle(self._start_selenium_probe)
 
-        self.widgets['selenium_status_label'] = tk.Label(
-            selenium_status_frame, text=selenium_status, bg=self.theme.colors['bg_secondary'],
-            fg=selenium_color, font=('Arial', 9, 'bold')
-        )
-        self.widgets['selenium_status_label'].pack(side='right', padx=10, pady=8)
+    def _start_selenium_probe(self):
+        """Lanza el sondeo de Selenium en un hilo de fondo, salvo que ya esté en caché"""
+        if _SELENIUM_AVAILABLE is not None:
+            self._set_selenium_status(_SELENIUM_AVAILABLE)
+            return
+        threading.Thread(target=self._probe_selenium, daemon=True).start()
+
+    def _probe_selenium(self):
+        """Sondea Selenium y devuelve el resultado al hilo de UI"""
+        available = is_selenium_available()
+        try:
+            self.widgets.selenium_status_label.after(0, self._set_selenium_status, available)
+        except (tk.TclError, RuntimeError):
+            pass  # La UI se cerró antes de terminar el sondeo
+
+    def _set_selenium_status(self, available):
+        """Actualiza el indicador de Selenium con el resultado del sondeo"""
+        prefix, status, color_key = _SELENIUM_STATUS[available]
+        try:
+            if not available:
+                self.selenium_prefix_label.configure(text=prefix)
+            self.widgets.selenium_status_label.configure(text=status, fg=self.theme.colors[color_key])
+        except tk.TclError:
+            pass
 
     def _create_styled_entry(self, parent, **kwargs):
-        """Crea un Entry con estilo consistente"""
-        entry = tk.Entry(
-            parent,
-            bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['text_primary'],
-            font=('Arial', 10),
-            relief='flat',
-            bd=10,
-            **kwargs
-        )
-        return entry
-
-    def _create_styled_button(self, parent, text, command, color):
-        """Crea un botón con estilo consistente"""
-        btn = tk.Button(
-            parent,
-            text=text,
-            command=command,
-            bg=color,
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            relief='flat',
-            padx=20,
-            pady=12,
-            cursor='hand2'
-        )
-        return btn
+        """Crea un Entry con estilo consistente (colores y fuente desde la base de opciones)"""
+        return tk.Entry(parent, bd=10, **kwargs)
 
-    def _toggle_password_visibility(self):
-        """Alterna visibilidad de contraseña"""
-        if self.widgets['show_password_var'].get():
-            self.widgets['password_entry'].configure(show='')
-        else:
-            self.widgets['password_entry'].configure(show='*')
+    def _on_show_password_changed(self, *_):
+        """Alterna visibilidad de contraseña al cambiar la variable del checkbox"""
+        self.widgets.password_entry.configure(show='' if self.widgets.show_password_var.get() else '*')
 
     def get_credentials(self):
         """Obtiene las credenciales del formulario"""
-        username = self.widgets['username_entry'].get().strip()
-        password = self.widgets['password_entry'].get().strip()
+        username = self.widgets.username_entry.get().strip()
+        password = self.widgets.password_entry.get().strip()
         return username, password
 
     def set_credentials(self, username, password):
         """Establece credenciales en el formulario"""
-        self.widgets['username_entry'].delete(0, 'end')
-        self.widgets['username_entry'].insert(0, username)
-        self.widgets['password_entry'].delete(0, 'end')
-        self.widgets['password_entry'].insert(0, password)
+        self.widgets.username_entry.delete(0, 'end')
+        self.widgets.username_entry.insert(0, username)
+        self.widgets.password_entry.delete(0, 'end')
+        self.widgets.password_entry.insert(0, password)
 
     def clear_credentials(self):
         """Limpia los campos de credenciales"""
-        self.widgets['username_entry'].delete(0, 'end')
-        self.widgets['password_entry'].delete(0, 'end')
-
-    def set_button_command(self, button_name, command):
-        """Establece comando para un botón específico"""
-        if button_name in self.widgets:
-            self.widgets[button_name].configure(command=command)
+        self.widgets.username_entry.delete(0, 'end')
+        self.widgets.password_entry.delete(0, 'end')
 
 
-class DateConfigForm:
+class DateConfigForm(_ButtonCommands):
     """Formulario de configuración de fechas para automatización"""
 
+    VALIDATION_DELAY_MS = 120
+
     def __init__(self, parent, theme=None):
         self.parent = parent
-        self.theme = theme or AutomationTheme()
-        self.widgets = {}
-        self.date_pattern = re.compile(r'^(\d{2})/(\d{2})/(\d{4})$')
+        self.theme = theme or _DEFAULT_THEME
+        self.widgets = DateConfigWidgets()
+        self._commands = {}
+        self._validate_after_ids = {}
+        self._label_state = {}
+        self._entry_names = {}
+        self._state_widgets = ()
+        self._last_state = None
+        self._today_cache = (None, '')
+        self._skip = True  # Espejo de skip_date_var
+        # Configuración recibida antes de construir los widgets (sección aún sin expandir)
+        self._pending_config = None
 
     def create(self):
         """Crea el formulario completo de configuración de fechas"""
-        content = tk.Frame(self.parent, bg=self.theme.colors['bg_primary'])
-        content.pack(fill='x', padx=18, pady=15)
+        _install_option_db(self.parent, self.theme)
+        content = tk.Frame(self.parent, class_='SyncroForm', bg=self.theme.colors['bg_primary'])
+        content.pack(fill='x', padx=METRICS.card_padx, pady=METRICS.card_pady)
 
         # Checkbox para omitir configuración de fecha
         self._create_skip_checkbox(content)
@@ -346,153 +724,137 @@ class DateConfigForm:
         self._create_action_buttons(content)
 
         # Estado inicial
+        self._state_widgets = (self.widgets.date_from_entry, self.widgets.date_to_entry,
+                               self.widgets.set_today_button, self.widgets.clear_dates_button)
         self._update_fields_state()
 
-        return self.widgets
+        if self._pending_config is not None:
+            config, self._pending_config = self._pending_config, None
+            self.set_date_config(config)
+
+        return self.widgets.as_dict()
 
     def _create_skip_checkbox(self, parent):
         """Crea checkbox para omitir configuración de fecha"""
-        checkbox_frame = tk.Frame(parent, bg=self.theme.colors['bg_tertiary'])
+        colors = self.theme.colors
+        checkbox_frame = tk.Frame(parent, bg=colors['bg_tertiary'])
         checkbox_frame.pack(fill='x', pady=(0, 15))
 
-        self.widgets['skip_date_var'] = tk.BooleanVar(value=True)  # Marcado por defecto
+        self.widgets.skip_date_var = tk.BooleanVar(value=True)  # Marcado por defecto
+        self.widgets.skip_date_var.trace_add('write', self._on_skip_var_write)
         skip_checkbox = tk.Checkbutton(
             checkbox_frame,
             text="📅 No tocar fechas (mantener comportamiento actual)",
-            variable=self.widgets['skip_date_var'],
+            variable=self.widgets.skip_date_var,
             command=self._on_skip_change,
-            bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['text_primary'],
-            font=('Arial', 10, 'bold'),
+            bg=colors['bg_tertiary'],
+            fg=colors['text_primary'],
+            font=_fonts()['bold10'],
             padx=15, pady=10
         )
         skip_checkbox.pack(anchor='w')
 
     def _create_date_fields(self, parent):
         """Crea los campos de fecha Desde y Hasta"""
-        dates_frame = tk.Frame(parent, bg=self.theme.colors['bg_primary'])
+        colors = self.theme.colors
+        dates_frame = tk.Frame(parent, bg=colors['bg_primary'])
         dates_frame.pack(fill='x', pady=(0, 15))
 
         # Instrucciones
         instructions_label = tk.Label(
             dates_frame,
             text="📋 Formato: DD/MM/YYYY (ejemplo: 10/08/2025)",
-            bg=self.theme.colors['bg_primary'],
-            fg=self.theme.colors['text_secondary'],
-            font=('Arial', 9)
+            bg=colors['bg_primary'],
+            fg=colors['text_secondary'],
+            font=_fonts()['body9']
         )
         instructions_label.pack(anchor='w', pady=(0, 10))
 
         # Frame para los campos
-        fields_frame = tk.Frame(dates_frame, bg=self.theme.colors['bg_tertiary'])
+        fields_frame = tk.Frame(dates_frame, bg=colors['bg_tertiary'])
         fields_frame.pack(fill='x')
 
-        fields_inner = tk.Frame(fields_frame, bg=self.theme.colors['bg_tertiary'])
+        fields_inner = tk.Frame(fields_frame, bg=colors['bg_tertiary'])
         fields_inner.pack(padx=15, pady=15)
 
         # Campo Desde
         tk.Label(
             fields_inner,
             text="📅 Fecha Desde:",
-            bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['text_primary'],
-            font=('Arial', 10, 'bold')
+            bg=colors['bg_tertiary'],
+            fg=colors['text_primary'],
+            font=_fonts()['bold10']
         ).grid(row=0, column=0, sticky='w', pady=(0, 8))
 
-        self.widgets['date_from_entry'] = self._create_styled_entry(fields_inner)
-        self.widgets['date_from_entry'].grid(row=0, column=1, sticky='ew', padx=(10, 0), pady=(0, 8))
+        self.widgets.date_from_entry = self._create_styled_entry(fields_inner)
+        self.widgets.date_from_entry.grid(row=0, column=1, sticky='ew', padx=(10, 0), pady=(0, 8))
 
         # Placeholder en el campo Desde
-        self.widgets['date_from_entry'].insert(0, "DD/MM/YYYY")
-        self.widgets['date_from_entry'].bind('<FocusIn>', lambda e: self._on_entry_focus_in(e, 'date_from_entry'))
-        self.widgets['date_from_entry'].bind('<FocusOut>', lambda e: self._on_entry_focus_out(e, 'date_from_entry'))
-        self.widgets['date_from_entry'].bind('<KeyRelease>', lambda e: self._validate_date_format(e, 'date_from_entry'))
+        self.widgets.date_from_entry.insert(0, DATE_PLACEHOLDER)
+        self._bind_date_entry(self.widgets.date_from_entry, 'date_from_entry')
 
         # Campo Hasta
         tk.Label(
             fields_inner,
             text="📅 Fecha Hasta:",
-            bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['text_primary'],
-            font=('Arial', 10, 'bold')
+            bg=colors['bg_tertiary'],
+            fg=colors['text_primary'],
+            font=_fonts()['bold10']
         ).grid(row=1, column=0, sticky='w')
 
-        self.widgets['date_to_entry'] = self._create_styled_entry(fields_inner)
-        self.widgets['date_to_entry'].grid(row=1, column=1, sticky='ew', padx=(10, 0))
+        self.widgets.date_to_entry = self._create_styled_entry(fields_inner)
+        self.widgets.date_to_entry.grid(row=1, column=1, sticky='ew', padx=(10, 0))
 
         # Placeholder en el campo Hasta
-        self.widgets['date_to_entry'].insert(0, "DD/MM/YYYY")
-        self.widgets['date_to_entry'].bind('<FocusIn>', lambda e: self._on_entry_focus_in(e, 'date_to_entry'))
-        self.widgets['date_to_entry'].bind('<FocusOut>', lambda e: self._on_entry_focus_out(e, 'date_to_entry'))
-        self.widgets['date_to_entry'].bind('<KeyRelease>', lambda e: self._validate_date_format(e, 'date_to_entry'))
+        self.widgets.date_to_entry.insert(0, DATE_PLACEHOLDER)
+        self._bind_date_entry(self.widgets.date_to_entry, 'date_to_entry')
 
         fields_inner.grid_columnconfigure(1, weight=1)
 
         # Labels de validación
-        self.widgets['date_from_validation'] = tk.Label(
+        self.widgets.date_from_validation = tk.Label(
             fields_inner,
             text="",
-            bg=self.theme.colors['bg_tertiary'],
-            font=('Arial', 8)
+            bg=colors['bg_tertiary'],
+            font=_fonts()['body8']
         )
-        self.widgets['date_from_validation'].grid(row=0, column=2, padx=(5, 0), pady=(0, 8))
+        self.widgets.date_from_validation.grid(row=0, column=2, padx=(5, 0), pady=(0, 8))
 
-        self.widgets['date_to_validation'] = tk.Label(
+        self.widgets.date_to_validation = tk.Label(
             fields_inner,
             text="",
-            bg=self.theme.colors['bg_tertiary'],
-            font=('Arial', 8)
+            bg=colors['bg_tertiary'],
+            font=_fonts()['body8']
         )
-        self.widgets['date_to_validation'].grid(row=1, column=2, padx=(5, 0))
+        self.widgets.date_to_validation.grid(row=1, column=2, padx=(5, 0))
 
     def _create_action_buttons(self, parent):
         """Crea botones de acción"""
-        buttons_frame = tk.Frame(parent, bg=self.theme.colors['bg_primary'])
+        colors = self.theme.colors
+        buttons_frame = tk.Frame(parent, bg=colors['bg_primary'])
         buttons_frame.pack(fill='x')
 
-        buttons_frame.grid_columnconfigure(0, weight=1)
-        buttons_frame.grid_columnconfigure(1, weight=1)
+        buttons_frame.grid_columnconfigure((0, 1), weight=1)
 
         # Botón establecer fecha actual
-        self.widgets['set_today_button'] = self._create_styled_button(
-            buttons_frame, "📅 Establecer Hoy", None, self.theme.colors['info']
+        self.widgets.set_today_button = _make_styled_button(
+            buttons_frame, "📅 Establecer Hoy", self._dispatcher('set_today_button'), colors['info']
         )
-        self.widgets['set_today_button'].grid(row=0, column=0, sticky='ew', padx=(0, 5))
+        self.widgets.set_today_button.grid(row=0, column=0, sticky='ew', padx=(0, 5))
 
         # Botón limpiar fechas
-        self.widgets['clear_dates_button'] = self._create_styled_button(
-            buttons_frame, "🗑️ Limpiar Fechas", None, self.theme.colors['warning']
+        self.widgets.clear_dates_button = _make_styled_button(
+            buttons_frame, "🗑️ Limpiar Fechas", self._dispatcher('clear_dates_button'), colors['warning']
         )
-        self.widgets['clear_dates_button'].grid(row=0, column=1, sticky='ew', padx=(5, 0))
+        self.widgets.clear_dates_button.grid(row=0, column=1, sticky='ew', padx=(5, 0))
 
     def _create_styled_entry(self, parent, **kwargs):
-        """Crea un Entry con estilo consistente"""
-        entry = tk.Entry(
-            parent,
-            bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['text_primary'],
-            font=('Arial', 10),
-            relief='flat',
-            bd=8,
-            **kwargs
-        )
-        return entry
-
-    def _create_styled_button(self, parent, text, command, color):
-        """Crea un botón con estilo consistente"""
-        btn = tk.Button(
-            parent,
-            text=text,
-            command=command,
-            bg=color,
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            relief='flat',
-            padx=20,
-            pady=12,
-            cursor='hand2'
-        )
-        return btn
+        """Crea un Entry con estilo consistente (colores y fuente desde la base de opciones)"""
+        return tk.Entry(parent, bd=8, **kwargs)
+
+    def _on_skip_var_write(self, *_):
+        """Refleja la variable del checkbox en Python para leerla sin ir a Tcl"""
+        self._skip = self.widgets.skip_date_var.get()
 
     def _on_skip_change(self):
         """Maneja cambio en checkbox de omitir fecha"""
@@ -500,81 +862,89 @@ class DateConfigForm:
 
     def _update_fields_state(self):
         """Actualiza estado de los campos según checkbox"""
-        skip_enabled = self.widgets['skip_date_var'].get()
-        state = 'disabled' if skip_enabled else 'normal'
+        state = 'disabled' if self._skip else 'normal'
+        if state == self._last_state:
+            return
 
         # Deshabilitar/habilitar campos
-        for widget_name in ['date_from_entry', 'date_to_entry', 'set_today_button', 'clear_dates_button']:
-            if widget_name in self.widgets:
-                self.widgets[widget_name].configure(state=state)
-
-    def _on_entry_focus_in(self, event, entry_name):
+        for widget in self._state_widgets:
+            widget.configure(state=state)
+        self._last_state = state
+
+    def _bind_date_entry(self, entry, entry_name):
+        """Enlaza los eventos del campo a manejadores compartidos que resuelven el campo por event.widget"""
+        self._entry_names[entry] = entry_name
+        entry.bind('<FocusIn>', self._on_entry_focus_in)
+        entry.bind('<FocusOut>', self._on_entry_focus_out)
+        entry.bind('<KeyRelease>', self._validate_date_format)
+
+    def _on_entry_focus_in(self, event):
         """Maneja focus in en campos de fecha"""
-        entry = self.widgets[entry_name]
-        if entry.get() == "DD/MM/YYYY":
+        entry = event.widget
+        if entry.get() == DATE_PLACEHOLDER:
             entry.delete(0, 'end')
-            entry.configure(fg=self.theme.colors['text_primary'])
+            _configure_if_changed(self._label_state, entry, fg=self.theme.colors['text_primary'])
 
-    def _on_entry_focus_out(self, event, entry_name):
+    def _on_entry_focus_out(self, event):
         """Maneja focus out en campos de fecha"""
-        entry = self.widgets[entry_name]
+        entry = event.widget
         if not entry.get().strip():
-            entry.insert(0, "DD/MM/YYYY")
-            entry.configure(fg=self.theme.colors['text_secondary'])
-
-    def _validate_date_format(self, event, entry_name):
+            entry.insert(0, DATE_PLACEHOLDER)
+            _configure_if_changed(self._label_state, entry, fg=self.theme.colors['text_secondary'])
+
+    def _validate_date_format(self, event):
+        """Programa la validación del campo tras una pausa en la escritura"""
+        entry = event.widget
+        entry_name = self._entry_names[entry]
+        after_id = self._validate_after_ids.get(entry_name)
+        if after_id is not None:
+            entry.after_cancel(after_id)
+        self._validate_after_ids[entry_name] = entry.after(
+            self.VALIDATION_DELAY_MS, self._validate_date_format_now, entry_name)
+
+    def _validate_date_format_now(self, entry_name):
         """Valida formato de fecha en tiempo real"""
-        entry = self.widgets[entry_name]
-        validation_label = self.widgets[f"{entry_name.replace('_entry', '_validation')}"]
+        colors = self.theme.colors
+        self._validate_after_ids.pop(entry_name, None)
+        entry = getattr(self.widgets, entry_name)
+        validation_label = getattr(self.widgets, entry_name.replace('_entry', '_validation'))
 
         date_text = entry.get().strip()
 
         # Ignorar placeholder
-        if date_text == "DD/MM/YYYY" or not date_text:
-            validation_label.configure(text="", fg=self.theme.colors['text_secondary'])
+        if date_text == DATE_PLACEHOLDER or not date_text:
+            _configure_if_changed(self._label_state, validation_label, text="", fg=colors['text_secondary'])
             return
 
         # Validar formato
         if self._is_valid_date_format(date_text):
-            validation_label.configure(text="✅", fg=self.theme.colors['success'])
+            _configure_if_changed(self._label_state, validation_label, text="✅", fg=colors['success'])
         else:
-            validation_label.configure(text="❌", fg=self.theme.colors['error'])
+            _configure_if_changed(self._label_state, validation_label, text="❌", fg=colors['error'])
 
     def _is_valid_date_format(self, date_text):
         """Verifica si el formato de fecha es válido"""
-        if not self.date_pattern.match(date_text):
-            return False
-
-        try:
-            day, month, year = map(int, date_text.split('/'))
-            # Verificar rangos básicos
-            if not (1 <= day <= 31 and 1 <= month <= 12 and 1900 <= year <= 2100):
-                return False
-
-            # Intentar crear fecha para validación completa
-            datetime(year, month, day)
-            return True
-        except ValueError:
-            return False
+        return _parse_ddmmyyyy(date_text) is not None
 
     def get_date_config(self):
         """Obtiene configuración actual de fechas"""
-        skip_dates = self.widgets['skip_date_var'].get()
+        if self.widgets.skip_date_var is None:
+            return self._get_pending_config()
 
-        if skip_dates:
+        if self._skip:
             return {
                 'skip_dates': True,
                 'date_from': None,
                 'date_to': None
             }
 
-        date_from = self.widgets['date_from_entry'].get().strip()
-        date_to = self.widgets['date_to_entry'].get().strip()
+        date_from = self.widgets.date_from_entry.get().strip()
+        date_to = self.widgets.date_to_entry.get().strip()
 
         # Limpiar placeholders
-        if date_from == "DD/MM/YYYY":
+        if date_from == DATE_PLACEHOLDER:
             date_from = ""
-        if date_to == "DD/MM/YYYY":
+        if date_to == DATE_PLACEHOLDER:
             date_to = ""
 
         return {
@@ -583,62 +953,81 @@ class DateConfigForm:
             'date_to': date_to if date_to else None
         }
 
+    def _get_pending_config(self):
+        """Configuración vigente mientras el formulario no se ha construido"""
+        config = self._pending_config or {}
+        if config.get('skip_dates', True):
+            return {'skip_dates': True, 'date_from': None, 'date_to': None}
+
+        return {
+            'skip_dates': False,
+            'date_from': config.get('date_from') or None,
+            'date_to': config.get('date_to') or None
+        }
+
     def set_date_config(self, config):
         """Establece configuración de fechas"""
+        if self.widgets.skip_date_var is None:
+            self._pending_config = dict(config)
+            return
+
         skip_dates = config.get('skip_dates', True)
-        self.widgets['skip_date_var'].set(skip_dates)
+        self.widgets.skip_date_var.set(skip_dates)
 
         if not skip_dates:
             date_from = config.get('date_from', '')
             date_to = config.get('date_to', '')
 
             # Limpiar y establecer fecha desde
-            self.widgets['date_from_entry'].delete(0, 'end')
-            if date_from:
-                self.widgets['date_from_entry'].insert(0, date_from)
-                self.widgets['date_from_entry'].configure(fg=self.theme.colors['text_primary'])
-            else:
-                self.widgets['date_from_entry'].insert(0, "DD/MM/YYYY")
-                self.widgets['date_from_entry'].configure(fg=self.theme.colors['text_secondary'])
+            self._set_entry_text(self.widgets.date_from_entry, date_from)
 
             # Limpiar y establecer fecha hasta
-            self.widgets['date_to_entry'].delete(0, 'end')
-            if date_to:
-                self.widgets['date_to_entry'].insert(0, date_to)
-                self.widgets['date_to_entry'].configure(fg=self.theme.colors['text_primary'])
-            else:
-                self.widgets['date_to_entry'].insert(0, "DD/MM/YYYY")
-                self.widgets['date_to_entry'].configure(fg=self.theme.colors['text_secondary'])
+            self._set_entry_text(self.widgets.date_to_entry, date_to)
 
         self._update_fields_state()
 
+    def _set_entry_text(self, entry, text):
+        """Escribe una fecha en el campo, o el placeholder si viene vacía (sin reescribir si ya coincide)"""
+        target = text or DATE_PLACEHOLDER
+        if entry.get() != target:
+            entry.delete(0, 'end')
+            entry.insert(0, target)
+        fg = self.theme.colors['text_primary' if text else 'text_secondary']
+        _configure_if_changed(self._label_state, entry, fg=fg)
+
     def clear_dates(self):
         """Limpia los campos de fecha"""
+        placeholder_fg = self.theme.colors['text_secondary']
         for entry_name in ['date_from_entry', 'date_to_entry']:
-            entry = self.widgets[entry_name]
-            entry.delete(0, 'end')
-            entry.insert(0, "DD/MM/YYYY")
-            entry.configure(fg=self.theme.colors['text_secondary'])
+            self._set_entry_text(getattr(self.widgets, entry_name), None)
 
             # Limpiar validación
             validation_name = entry_name.replace('_entry', '_validation')
-            if validation_name in self.widgets:
-                self.widgets[validation_name].configure(text="")
+            validation_label = getattr(self.widgets, validation_name)
+            if validation_label is not None:
+                _configure_if_changed(self._label_state, validation_label, text="", fg=placeholder_fg)
+
+    def _today_text(self):
+        """Fecha de hoy en DD/MM/YYYY, formateada solo una vez por día"""
+        today = datetime.now()
+        ordinal = today.toordinal()
+        if self._today_cache[0] != ordinal:
+            self._today_cache = (ordinal, today.strftime(DATE_FORMAT))
+        return self._today_cache[1]
 
     def set_today_dates(self):
         """Establece fechas actuales en ambos campos"""
-        today = datetime.now().strftime("%d/%m/%Y")
+        valid_fg = self.theme.colors['success']
+        today = self._today_text()
 
         for entry_name in ['date_from_entry', 'date_to_entry']:
-            entry = self.widgets[entry_name]
-            entry.delete(0, 'end')
-            entry.insert(0, today)
-            entry.configure(fg=self.theme.colors['text_primary'])
+            self._set_entry_text(getattr(self.widgets, entry_name), today)
 
             # Actualizar validación
             validation_name = entry_name.replace('_entry', '_validation')
-            if validation_name in self.widgets:
-                self.widgets[validation_name].configure(text="✅", fg=self.theme.colors['success'])
+            validation_label = getattr(self.widgets, validation_name)
+            if validation_label is not None:
+                _configure_if_changed(self._label_state, validation_label, text="✅", fg=valid_fg)
 
     def validate_date_range(self):
         """Valida que el rango de fechas sea correcto"""
@@ -659,31 +1048,19 @@ class DateConfigForm:
             return True, "Una fecha especificada"
 
         # Validar formato
-        if not self._is_valid_date_format(date_from):
+        from_date = _parse_ddmmyyyy(date_from)
+        if from_date is None:
             return False, f"Formato de fecha 'Desde' inválido: {date_from}"
 
-        if not self._is_valid_date_format(date_to):
+        to_date = _parse_ddmmyyyy(date_to)
+        if to_date is None:
             return False, f"Formato de fecha 'Hasta' inválido: {date_to}"
 
         # Validar rango
-        try:
-            from_parts = date_from.split('/')
-            to_parts = date_to.split('/')
-
-            from_date = datetime(int(from_parts[2]), int(from_parts[1]), int(from_parts[0]))
-            to_date = datetime(int(to_parts[2]), int(to_parts[1]), int(to_parts[0]))
+        if from_date > to_date:
+            return False, "La fecha 'Desde' no puede ser posterior a 'Hasta'"
 
-            if from_date > to_date:
-                return False, "La fecha 'Desde' no puede ser posterior a 'Hasta'"
-
-            return True, "Rango de fechas válido"
-        except Exception as e:
-            return False, f"Error validando rango: {str(e)}"
-
-    def set_button_command(self, button_name, command):
-        """Establece comando para un botón específico"""
-        if button_name in self.widgets:
-            self.widgets[button_name].configure(command=command)
+        return True, "Rango de fechas válido"
 
 
 class StatusPanel:
@@ -691,13 +1068,15 @@ class StatusPanel:
 
     def __init__(self, parent, theme=None):
         self.parent = parent
-        self.theme = theme or AutomationTheme()
-        self.widgets = {}
+        self.theme = theme or _DEFAULT_THEME
+        self.widgets = StatusWidgets()
+        self._label_state = {}
 
     def create(self):
         """Crea el panel de estado"""
-        content = tk.Frame(self.parent, bg=self.theme.colors['bg_primary'])
-        content.pack(fill='x', padx=18, pady=15)
+        _install_option_db(self.parent, self.theme)
+        content = tk.Frame(self.parent, class_='SyncroPanel')
+        content.pack(fill='x', padx=METRICS.card_padx, pady=METRICS.card_pady)
 
         # Estado de automatización
         self._create_automation_status(content)
@@ -705,220 +1084,319 @@ class StatusPanel:
         # URL objetivo
         self._create_url_status(content)
 
-        return self.widgets
+        return self.widgets.as_dict()
 
     def _create_automation_status(self, parent):
         """Crea indicador de estado de automatización"""
-        status_frame = tk.Frame(parent, bg=self.theme.colors['bg_tertiary'])
+        status_frame = tk.Frame(parent, class_='SyncroRow')
         status_frame.pack(fill='x', pady=(0, 10))
 
-        tk.Label(status_frame, text="🤖 Automatización:", bg=self.theme.colors['bg_tertiary'],
-                 fg=self.theme.colors['text_primary'], font=('Arial', 10)).pack(
+        tk.Label(status_frame, text="🤖 Automatización:", font=_fonts()['body10']).pack(
             side='left', padx=10, pady=8)
 
-        self.widgets['automation_status'] = tk.Label(
-            status_frame, text="Detenida", bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['text_secondary'], font=('Arial', 10, 'bold')
+        self.widgets.automation_status = tk.Label(
+            status_frame, text="Detenida",
+            fg=self.theme.colors['text_secondary'], font=_fonts()['bold10']
         )
-        self.widgets['automation_status'].pack(side='right', padx=10, pady=8)
+        self.widgets.automation_status.pack(side='right', padx=10, pady=8)
 
     def _create_url_status(self, parent):
         """Crea indicador de URL objetivo"""
-        url_frame = tk.Frame(parent, bg=self.theme.colors['bg_tertiary'])
+        url_frame = tk.Frame(parent, class_='SyncroRow')
         url_frame.pack(fill='x')
 
-        tk.Label(url_frame, text="🌐 URL Objetivo:", bg=self.theme.colors['bg_tertiary'],
-                 fg=self.theme.colors['text_primary'], font=('Arial', 10)).pack(
+        tk.Label(url_frame, text="🌐 URL Objetivo:", font=_fonts()['body10']).pack(
             side='left', padx=10, pady=8)
 
-        self.widgets['url_status'] = tk.Label(
-            url_frame, text="Cabletica Dispatch", bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['info'], font=('Arial', 10, 'bold')
+        self.widgets.url_status = tk.Label(
+            url_frame, text="Cabletica Dispatch",
+            fg=self.theme.colors['info'], font=_fonts()['bold10']
         )
-        self.widgets['url_status'].pack(side='right', padx=10, pady=8)
+        self.widgets.url_status.pack(side='right', padx=10, pady=8)
 
     def update_automation_status(self, text, color=None):
         """Actualiza el estado de automatización"""
         if color is None:
             color = self.theme.colors['text_secondary']
-        self.widgets['automation_status'].configure(text=text, fg=color)
+        _configure_if_changed(self._label_state, self.widgets.automation_status, text=text, fg=color)
 
     def update_url_status(self, text):
         """Actualiza el estado de URL"""
-        self.widgets['url_status'].configure(text=text)
+        _configure_if_changed(self._label_state, self.widgets.url_status, text=text)
 
 
-class ControlPanel:
+class ControlPanel(_ButtonCommands):
     """Panel de controles de automatización"""
 
     def __init__(self, parent, theme=None):
         self.parent = parent
-        self.theme = theme or AutomationTheme()
-        self.widgets = {}
+        self.theme = theme or _DEFAULT_THEME
+        self.widgets = ControlWidgets()
+        self._commands = {}
+        self._button_state = {}
 
     def create(self):
         """Crea el panel de controles"""
-        content = tk.Frame(self.parent, bg=self.theme.colors['bg_primary'])
-        content.pack(fill='x', padx=18, pady=15)
+        colors = self.theme.colors
+        _install_option_db(self.parent, self.theme)
+        content = tk.Frame(self.parent, class_='SyncroPanel')
+        content.pack(fill='x', padx=METRICS.card_padx, pady=METRICS.card_pady)
 
         # Botón iniciar
-        self.widgets['start_button'] = self._create_styled_button(
+        self.widgets.start_button = _make_styled_button(
             content, "▶️ Iniciar Automatización con Login",
-            None, self.theme.colors['success']
+            self._dispatcher('start_button'), colors['success']
         )
-        self.widgets['start_button'].pack(fill='x', pady=(0, 15))
+        self.widgets.start_button.pack(fill='x', pady=(0, 15))
 
         # Botón pausar
-        self.widgets['pause_button'] = self._create_styled_button(
+        self.widgets.pause_button = _make_styled_button(
             content, "⏸️ Pausar Automatización",
-            None, self.theme.colors['warning']
-        )
-        self.widgets['pause_button'].pack(fill='x')
-        self.widgets['pause_button'].configure(state='disabled')
-
-        return self.widgets
-
-    def _create_styled_button(self, parent, text, command, color):
-        """Crea un botón con estilo consistente"""
-        btn = tk.Button(
-            parent,
-            text=text,
-            command=command,
-            bg=color,
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            relief='flat',
-            padx=20,
-            pady=12,
-            cursor='hand2'
+            self._dispatcher('pause_button'), colors['warning']
         )
-        return btn
+        self.widgets.pause_button.pack(fill='x')
+        self.set_button_state('pause_button', 'disabled')
 
-    def set_button_command(self, button_name, command):
-        """Establece comando para un botón específico"""
-        if button_name in self.widgets:
-            self.widgets[button_name].configure(command=command)
+        return self.widgets.as_dict()
 
     def set_button_state(self, button_name, state):
         """Establece estado de un botón"""
-        if button_name in self.widgets:
-            self.widgets[button_name].configure(state=state)
+        button = getattr(self.widgets, button_name, None)
+        if button is not None:
+            _configure_if_changed(self._button_state, button, state=state)
 
     def set_button_text(self, button_name, text):
         """Establece texto de un botón"""
-        if button_name in self.widgets:
-            self.widgets[button_name].configure(text=text)
+        button = getattr(self.widgets, button_name, None)
+        if button is not None:
+            _configure_if_changed(self._button_state, button, text=text)
 
 
-class LogPanel:
+class LogPanel(_ButtonCommands):
     """Panel de log con funcionalidades avanzadas"""
 
+    # Nivel de log -> tag de color del Text
+    LEVEL_TAGS = {
+        'DEBUG': 'debug',
+        'INFO': 'info',
+        'WARNING': 'warn',
+        'ERROR': 'error',
+        'CRITICAL': 'error',
+        'SUCCESS': 'success'
+    }
+
+    # Líneas a partir de las cuales el log pasa del Text a un Treeview, y tope de líneas en ese modo
+    TREEVIEW_THRESHOLD = 5000
+    TREEVIEW_MAX_LINES = 10000
+
+    # Intervalo del volcado periódico de líneas pendientes al widget
+    FLUSH_INTERVAL_MS = 100
+
     def __init__(self, parent, theme=None):
         self.parent = parent
-        self.theme = theme or AutomationTheme()
-        self.widgets = {}
+        self.theme = theme or _DEFAULT_THEME
+        self.widgets = LogWidgets()
+        self._commands = {}
+
+        # Líneas pendientes de volcar (texto, tag); deque admite append desde otros hilos
+        self._pending = deque()
+
+        # Conteo de líneas y items del Treeview (buffer circular)
+        self._line_count = 0
+        self._tree_items = deque()
 
     def create(self):
         """Crea el panel de log"""
+        colors = self.theme.colors
         # Crear card frame
         card = self._create_card_frame(self.parent, "📋 Log de Actividades")
 
         # Área de texto con scroll
-        self.widgets['log_text'] = scrolledtext.ScrolledText(
+        self.widgets.log_text = scrolledtext.ScrolledText(
             card,
-            bg=self.theme.colors['bg_tertiary'],
-            fg=self.theme.colors['text_primary'],
-            font=('Consolas', 9),
+            bg=colors['bg_tertiary'],
+            fg=colors['text_primary'],
+            font=_fonts()['mono'],
             relief='flat',
             wrap=tk.WORD,
             state=tk.DISABLED
         )
-        self.widgets['log_text'].pack(fill='both', expand=True, pady=(0, 10))
+        self.widgets.log_text.pack(fill='both', expand=True, pady=(0, 10))
+        self._configure_tags()
 
         # Botón para limpiar log
-        self.widgets['clear_log_button'] = self._create_styled_button(
-            card, "🗑️ Limpiar Log", None, self.theme.colors['text_secondary']
+        self.widgets.clear_log_button = _make_styled_button(
+            card, "🗑️ Limpiar Log", self._dispatcher('clear_log_button'), colors['text_secondary']
         )
-        self.widgets['clear_log_button'].pack(fill='x')
+        self.widgets.clear_log_button.pack(fill='x')
 
-        return self.widgets
+        self._schedule_flush()
+
+        return self.widgets.as_dict()
 
     def _create_card_frame(self, parent, title):
         """Crea un frame tipo tarjeta"""
-        container = tk.Frame(parent, bg=self.theme.colors['bg_primary'])
-        container.pack(fill='both', expand=True)
-
-        card = tk.Frame(container, bg=self.theme.colors['bg_primary'], relief='solid', bd=1)
-        card.configure(highlightbackground=self.theme.colors['border'],
-                       highlightcolor=self.theme.colors['border'],
-                       highlightthickness=1)
+        card, _, _, content = build_card(parent, title, self.theme)
         card.pack(fill='both', expand=True)
+        card.grid_rowconfigure(1, weight=1)
+        content.grid(row=1, column=0, sticky='nsew', padx=METRICS.card_padx, pady=METRICS.card_pady)
 
-        # Header
-        header = tk.Frame(card, bg=self.theme.colors['bg_secondary'], height=45)
-        header.pack(fill='x')
-        header.pack_propagate(False)
+        return content
 
-        tk.Label(header, text=title, bg=self.theme.colors['bg_secondary'],
-                 fg=self.theme.colors['text_primary'], font=('Arial', 12, 'bold')).pack(
-            side='left', padx=15, pady=12)
+    def _tag_colors(self):
+        """Colores de cada tag de nivel"""
+        colors = self.theme.colors
+        return {
+            'debug': colors['text_secondary'],
+            'info': colors['text_primary'],
+            'warn': colors['warning'],
+            'error': colors['error'],
+            'success': colors['success']
+        }
 
-        # Content area
-        content = tk.Frame(card, bg=self.theme.colors['bg_primary'])
-        content.pack(fill='both', expand=True, padx=18, pady=15)
+    def _configure_tags(self):
+        """Configura una sola vez los tags de color por nivel"""
+        log_text = self.widgets.log_text
+        for tag, color in self._tag_colors().items():
+            log_text.tag_configure(tag, foreground=color)
 
-        return content
+    def append(self, line, level='info'):
+        """Agrega una línea al log sin tocar Tk (seguro desde hilos de trabajo); se vuelca en el próximo ciclo"""
+        self._pending.append((line, self.LEVEL_TAGS.get(level.upper(), 'info')))
 
-    def _create_styled_button(self, parent, text, command, color):
-        """Crea un botón con estilo consistente"""
-        btn = tk.Button(
-            parent,
-            text=text,
-            command=command,
-            bg=color,
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            relief='flat',
-            padx=20,
-            pady=12,
-            cursor='hand2'
-        )
-        return btn
+    def _schedule_flush(self):
+        """Programa el siguiente volcado periódico en el hilo de UI"""
+        self.widgets.log_text.after(self.FLUSH_INTERVAL_MS, self._poll_pending)
 
-    def set_clear_command(self, command):
-        """Establece comando para limpiar log"""
-        self.widgets['clear_log_button'].configure(command=command)
+    def _poll_pending(self):
+        """Vuelca lo pendiente y se reprograma mientras el widget exista"""
+        try:
+            self._flush()
+            self._schedule_flush()
+        except tk.TclError:
+            pass  # Widget destruido: se deja de sondear
+
+    def _flush(self):
+        """Inserta las líneas pendientes con un solo insert (un bloque por tramo del mismo tag)"""
+        pending = self._pending
+        if not pending:
+            return
+        pending = [pending.popleft() for _ in range(len(pending))]
 
+        self._line_count += len(pending)
+        if self.widgets.log_tree is None and self._line_count > self.TREEVIEW_THRESHOLD:
+            self._switch_to_treeview()
 
-class AutomationUIFactory:
-    """Factory para crear componentes UI de automatización"""
+        if self.widgets.log_tree is not None:
+            self._insert_tree_lines(pending)
+            return
 
-    @staticmethod
-    def create_collapsible_section(parent, section_id, title, theme=None):
-        """Crea una sección colapsable"""
-        return CollapsibleSection(parent, section_id, title, theme)
+        chunks = []
+        for tag, lines in groupby(pending, key=itemgetter(1)):
+            chunks.append("".join(line + "\n" for line, _ in lines))
+            chunks.append(tag)
+
+        log_text = self.widgets.log_text
+        log_text.configure(state=tk.NORMAL)
+        log_text.insert(tk.END, *chunks)
+        log_text.configure(state=tk.DISABLED)
+        log_text.see(tk.END)
+
+    def _switch_to_treeview(self):
+        """Reemplaza el Text por un Treeview que solo dibuja las filas visibles"""
+        log_text = self.widgets.log_text
+
+        tree_frame = tk.Frame(log_text.frame.master)
+        tree = ttk.Treeview(tree_frame, show='tree', selectmode='none')
+        scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y')
+        tree.pack(side='left', fill='both', expand=True)
+
+        for tag, color in self._tag_colors().items():
+            tree.tag_configure(tag, foreground=color)
+
+        # Ocupar el lugar del Text con las mismas opciones de pack
+        pack_options = log_text.pack_info()
+        pack_options['before'] = log_text.frame
+        tree_frame.pack(**pack_options)
+        log_text.pack_forget()
+
+        # Migrar las líneas existentes con su tag y liberar el buffer del Text
+        existing = log_text.get('1.0', 'end-1c').splitlines()
+        line_tags = self._read_line_tags(log_text, len(existing))
+        log_text.configure(state=tk.NORMAL)
+        log_text.delete(1.0, tk.END)
+        log_text.configure(state=tk.DISABLED)
+
+        self.widgets.log_tree = tree
+        self._insert_tree_lines(list(zip(existing, line_tags)))
+
+    def _read_line_tags(self, log_text, line_total):
+        """Obtiene el tag de nivel de cada línea del Text a partir de sus rangos de tags"""
+        line_tags = ['info'] * line_total
+        for tag in self._tag_colors():
+            ranges = log_text.tag_ranges(tag)
+            for start, end in zip(ranges[::2], ranges[1::2]):
+                first = int(str(start).split('.')[0])
+                last_line, last_col = str(end).split('.')
+                # Un rango que termina en columna 0 acaba en el salto de línea de la línea anterior
+                last = int(last_line) if last_col != '0' else int(last_line) - 1
+                for line_number in range(first, min(last, line_total) + 1):
+                    line_tags[line_number - 1] = tag
+        return line_tags
+
+    def _insert_tree_lines(self, entries):
+        """Inserta filas en el Treeview y descarta las más antiguas sobre el tope"""
+        tree = self.widgets.log_tree
+        for line, tag in entries:
+            self._tree_items.append(tree.insert('', 'end', text=line, tags=(tag,)))
+
+        overflow = len(self._tree_items) - self.TREEVIEW_MAX_LINES
+        if overflow > 0:
+            tree.delete(*[self._tree_items.popleft() for _ in range(overflow)])
+
+        if self._tree_items:
+            tree.see(self._tree_items[-1])
+
+    def clear(self):
+        """Limpia el contenido del log y las líneas pendientes"""
+        self._pending.clear()
+        self._line_count = 0
+
+        if self.widgets.log_tree is not None:
+            self.widgets.log_tree.delete(*self._tree_items)
+            self._tree_items.clear()
+            return
 
-    @staticmethod
-    def create_credentials_form(parent, theme=None):
-        """Crea un formulario de credenciales"""
-        return CredentialsForm(parent, theme)
+        log_text = self.widgets.log_text
+        log_text.configure(state=tk.NORMAL)
+        log_text.delete(1.0, tk.END)
+        log_text.configure(state=tk.DISABLED)
 
-    @staticmethod
-    def create_date_config_form(parent, theme=None):
-        """Crea un formulario de configuración de fechas"""
-        return DateConfigForm(parent, theme)
+    def set_clear_command(self, command):
+        """Establece comando para limpiar log"""
+        self.set_button_command('clear_log_button', command)
 
-    @staticmethod
-    def create_status_panel(parent, theme=None):
-        """Crea un panel de estado"""
-        return StatusPanel(parent, theme)
 
-    @staticmethod
-    def create_control_panel(parent, theme=None):
-        """Crea un panel de controles"""
-        return ControlPanel(parent, theme)
+class AutomationUIFactory:
+    """Factory para crear componentes UI de automatización"""
 
     @staticmethod
-    def create_log_panel(parent, theme=None):
-        """Crea un panel de log"""
-        return LogPanel(parent, theme)
\ No newline at end of file
+    def create_collapsible_section(parent, section_id, title, theme=None, cache=None, builder=None):
+        """Crea una sección colapsable (o la reutiliza desde la caché si se indica)"""
+        if cache is None:
+            return CollapsibleSection(parent, section_id, title, theme, builder)
+
+        section = cache.get(section_id)
+        if section is None:
+            section = cache.register(CollapsibleSection(parent, section_id, title, theme, builder))
+        return section
+
+    # Constructores directos (sin función intermedia)
+    create_section_cache = staticmethod(SectionCache)
+    create_credentials_form = staticmethod(CredentialsForm)
+    create_date_config_form = staticmethod(DateConfigForm)
+    create_status_panel = staticmethod(StatusPanel)
+    create_control_panel = staticmethod(ControlPanel)
+    create_log_panel = staticmethod(LogPanel)
@@ -3,16 +3,24 @@
 """
 Gestor de credenciales con encriptación para el sistema de automatización.
 Maneja el almacenamiento seguro, validación y recuperación de credenciales
-de login con encriptación mediante cryptography.fernet.
+de login con encriptación AES-GCM (formato v2) o cryptography.fernet (archivos anteriores).
 """
 
+import base64
 import json
 import os
+import shutil
 from datetime import datetime
+from pathlib import Path
+
+from .file_utils import write_atomic
 
 # Importaciones para encriptación de credenciales
 try:
     from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
     CRYPTO_AVAILABLE = True
 except ImportError:
@@ -20,6 +28,17 @@ except ImportError:
     print("Error: La librería 'cryptography' no está instalada.")
     print("Instale con: pip install cryptography")
 
+# Serialización JSON directa a bytes (opcional, con json estándar como respaldo)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Formato v2 en disco: MAGIC + nonce de 12 bytes + texto cifrado con tag GCM (sin base64)
+CREDENTIALS_MAGIC = b"SYC2"
+NONCE_SIZE = 12
 
 class CredentialsManager:
     """Gestor de credenciales con encriptación para login automático"""
@@ -27,6 +46,17 @@ class CredentialsManager:
     def __init__(self):
         self.config_file = "automation_credentials.json"
         self.key_file = "automation.key"
+        self._config_path = Path(self.config_file)
+        self._key_path = Path(self.key_file)
+
+        # Clave y cifrador en memoria tras el primer uso
+        self._key = None
+        self._fernet = None
+        self._aead = None
+
+        # Credenciales descifradas y (mtime_ns, tamaño) del archivo del que salieron
+        self._creds_cache = None
+        self._creds_cache_stat = None
 
     def is_crypto_available(self):
         """Verifica si la encriptación está disponible"""
@@ -37,42 +67,56 @@ class CredentialsManager:
         if not CRYPTO_AVAILABLE:
             raise ImportError("cryptography no está disponible")
 
-        if os.path.exists(self.key_file):
-            with open(self.key_file, 'rb') as f:
-                return f.read()
-        else:
+        if self._key is not None:
+            return self._key
+
+        try:
+            key = self._key_path.read_bytes()
+        except FileNotFoundError:
             key = Fernet.generate_key()
-            with open(self.key_file, 'wb') as f:
-                f.write(key)
-            return key
+            self._key_path.write_bytes(key)
+
+        self._key = key
+        self._fernet = Fernet(key)
+        # Subclave AES-256 derivada de la clave Fernet para el formato v2
+        aead_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                        info=b"syncro-automation-credentials-v2").derive(base64.urlsafe_b64decode(key))
+        self._aead = AESGCM(aead_key)
+        return key
+
+    def _get_fernet(self):
+        """Obtiene el cifrador Fernet, creándolo una sola vez por clave"""
+        if self._fernet is None:
+            self._get_or_create_key()
+        return self._fernet
+
+    def _get_aead(self):
+        """Obtiene el cifrador AES-GCM del formato v2, creándolo una sola vez por clave"""
+        if self._aead is None:
+            self._get_or_create_key()
+        return self._aead
 
     def _clean_string(self, text):
         """Limpia caracteres problemáticos de un string"""
         if not isinstance(text, str):
             return text
-        text = text.replace('\xa0', ' ')
-        text = text.replace('\u00a0', ' ')
-        text = ' '.join(text.split())
-        return text.strip()
+        # split() sin argumentos ya trata '\xa0' como espacio: una sola pasada normaliza y recorta
+        return ' '.join(text.split())
 
     def _encrypt_data(self, data):
         """Encripta los datos de credenciales"""
         if not CRYPTO_AVAILABLE:
             raise ImportError("cryptography no está disponible para encriptar")
 
-        key = self._get_or_create_key()
-        fernet = Fernet(key)
-
-        clean_data = {}
-        for key_name, value in data.items():
-            if isinstance(value, str):
-                clean_data[key_name] = self._clean_string(value)
-            else:
-                clean_data[key_name] = value
+        clean_data = {key_name: self._clean_string(value) if type(value) is str else value
+                      for key_name, value in data.items()}
 
-        json_str = json.dumps(clean_data, ensure_ascii=True)
-        encrypted_data = fernet.encrypt(json_str.encode('utf-8'))
-        return encrypted_data
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(clean_data)
+        else:
+            payload = json.dumps(clean_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        nonce = os.urandom(NONCE_SIZE)
+        return CREDENTIALS_MAGIC + nonce + self._get_aead().encrypt(nonce, payload, CREDENTIALS_MAGIC)
 
     def _decrypt_data(self, encrypted_data):
         """Desencripta los datos de credenciales"""
@@ -80,13 +124,22 @@ class CredentialsManager:
             return None
 
         try:
-            key = self._get_or_create_key()
-            fernet = Fernet(key)
-            decrypted_data = fernet.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode('utf-8'))
+            if encrypted_data.startswith(CREDENTIALS_MAGIC):
+                header_size = len(CREDENTIALS_MAGIC) + NONCE_SIZE
+                nonce = encrypted_data[len(CREDENTIALS_MAGIC):header_size]
+                decrypted_data = self._get_aead().decrypt(nonce, encrypted_data[header_size:], CREDENTIALS_MAGIC)
+            else:
+                # Archivos anteriores al formato v2
+                decrypted_data = self._get_fernet().decrypt(encrypted_data)
+            return orjson.loads(decrypted_data) if ORJSON_AVAILABLE else json.loads(decrypted_data)
         except Exception:
             return None
 
+    def _invalidate_credentials_cache(self):
+        """Descarta las credenciales en memoria tras escribir o borrar el archivo"""
+        self._creds_cache = None
+        self._creds_cache_stat = None
+
     def save_credentials(self, username, password):
         """Guarda las credenciales encriptadas"""
         if not CRYPTO_AVAILABLE:
@@ -94,13 +147,13 @@ class CredentialsManager:
 
         try:
             credentials_data = {
-                "username": self._clean_string(username),
-                "password": self._clean_string(password),
+                "username": username,
+                "password": password,
                 "saved_at": datetime.now().isoformat()
             }
             encrypted_data = self._encrypt_data(credentials_data)
-            with open(self.config_file, 'wb') as f:
-                f.write(encrypted_data)
+            write_atomic(self.config_file, encrypted_data)
+            self._invalidate_credentials_cache()
             return True, "Credenciales guardadas correctamente"
         except Exception as e:
             print(f"Error guardando credenciales: {e}")
@@ -112,27 +165,41 @@ class CredentialsManager:
             return None
 
         try:
-            if not os.path.exists(self.config_file):
+            try:
+                stat = os.stat(self.config_file)
+            except FileNotFoundError:
                 return None
 
-            with open(self.config_file, 'rb') as f:
-                encrypted_data = f.read()
-
-            return self._decrypt_data(encrypted_data)
+            return self._load_credentials_for(stat)
         except Exception as e:
             print(f"Error cargando credenciales: {e}")
             return None
 
+    def _load_credentials_for(self, stat):
+        """Devuelve las credenciales del archivo ya consultado con os.stat, descifrando solo si cambió"""
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+        if file_stamp != self._creds_cache_stat:
+            self._creds_cache = self._decrypt_data(self._config_path.read_bytes())
+            self._creds_cache_stat = file_stamp
+
+        return dict(self._creds_cache) if self._creds_cache is not None else None
+
     def clear_credentials(self):
         """Elimina las credenciales guardadas"""
         try:
+            # La clave se elimina del disco: descartar también la copia en memoria
+            self._key = None
+            self._fernet = None
+            self._aead = None
+            self._invalidate_credentials_cache()
+
             files_removed = 0
-            if os.path.exists(self.config_file):
-                os.remove(self.config_file)
-                files_removed += 1
-            if os.path.exists(self.key_file):
-                os.remove(self.key_file)
-                files_removed += 1
+            for path in (self.config_file, self.key_file):
+                try:
+                    os.remove(path)
+                    files_removed += 1
+                except FileNotFoundError:
+                    pass
             return True, f"Se eliminaron {files_removed} archivos de credenciales"
         except Exception as e:
             return False, f"Error eliminando credenciales: {str(e)}"
@@ -151,18 +218,15 @@ class CredentialsManager:
         if len(password) < 3:
             return False, "La contraseña debe tener al menos 3 caracteres"
 
-        # Validaciones adicionales
-        if username.strip() != username:
-            return False, "El usuario no puede empezar o terminar con espacios"
-        if password.strip() != password:
-            return False, "La contraseña no puede empezar o terminar con espacios"
-
+        # _clean_string ya recorta los extremos: no hace falta comprobar espacios iniciales/finales
         return True, "Credenciales válidas"
 
     def get_credentials_info(self):
         """Obtiene información sobre las credenciales guardadas sin mostrar datos sensibles"""
         try:
-            if not os.path.exists(self.config_file):
+            try:
+                stat = os.stat(self.config_file)
+            except FileNotFoundError:
                 return {
                     'exists': False,
                     'username': None,
@@ -170,20 +234,20 @@ class CredentialsManager:
                     'file_size': 0
                 }
 
-            credentials = self.load_credentials()
+            credentials = self._load_credentials_for(stat) if CRYPTO_AVAILABLE else None
             if not credentials:
                 return {
                     'exists': False,
                     'username': None,
                     'saved_at': None,
-                    'file_size': os.path.getsize(self.config_file)
+                    'file_size': stat.st_size
                 }
 
             return {
                 'exists': True,
                 'username': credentials.get('username', ''),
                 'saved_at': credentials.get('saved_at', ''),
-                'file_size': os.path.getsize(self.config_file)
+                'file_size': stat.st_size
             }
         except Exception as e:
             return {
@@ -205,9 +269,7 @@ class CredentialsManager:
                 backup_path = f"backup_credentials_{timestamp}.json"
 
             # Copiar archivo encriptado
-            with open(self.config_file, 'rb') as source:
-                with open(backup_path, 'wb') as backup:
-                    backup.write(source.read())
+            shutil.copyfile(self.config_file, backup_path)
 
             return True, f"Backup creado en: {backup_path}"
         except Exception as e:
@@ -216,13 +278,12 @@ class CredentialsManager:
     def restore_credentials(self, backup_path):
         """Restaura credenciales desde un backup"""
         try:
-            if not os.path.exists(backup_path):
+            # Verificar que el backup sea válido (una sola lectura, reutilizada para restaurar)
+            try:
+                backup_data = Path(backup_path).read_bytes()
+            except FileNotFoundError:
                 return False, "Archivo de backup no encontrado"
 
-            # Verificar que el backup sea válido
-            with open(backup_path, 'rb') as f:
-                backup_data = f.read()
-
             # Intentar desencriptar para validar
             test_credentials = self._decrypt_data(backup_data)
             if not test_credentials:
@@ -232,13 +293,13 @@ class CredentialsManager:
             if os.path.exists(self.config_file):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 current_backup = f"current_credentials_backup_{timestamp}.json"
-                with open(self.config_file, 'rb') as current:
-                    with open(current_backup, 'wb') as backup:
-                        backup.write(current.read())
+                shutil.copyfile(self.config_file, current_backup)
 
-            # Restaurar credenciales
-            with open(self.config_file, 'wb') as f:
-                f.write(backup_data)
+            # Restaurar credenciales; lo ya descifrado queda como caché del nuevo archivo
+            write_atomic(self.config_file, backup_data)
+            stat = os.stat(self.config_file)
+            self._creds_cache = test_credentials
+            self._creds_cache_stat = (stat.st_mtime_ns, stat.st_size)
 
             return True, "Credenciales restauradas correctamente"
         except Exception as e:
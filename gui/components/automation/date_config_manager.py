@@ -9,7 +9,12 @@ de fechas para el sistema de automatización con formato DD/MM/YYYY.
 import json
 import os
 import re
-from datetime import datetime, timedelta
+import shutil
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from .file_utils import write_atomic
 
 # Importaciones para encriptación
 try:
@@ -21,6 +26,56 @@ except ImportError:
     print("Warning: cryptography no está disponible para configuración de fechas.")
     print("Instale con: pip install cryptography")
 
+# Serialización JSON directa a bytes (opcional, con json estándar como respaldo)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@lru_cache(maxsize=512)
+def _validate_date_format_cached(date_str):
+    """Valida una fecha DD/MM/YYYY ya limpia; devuelve (válida, mensaje, datetime o None) memoizado"""
+    # Verificar estructura de ancho fijo DD/MM/YYYY (equivalente a date_pattern, sin regex)
+    day_str, month_str, year_str = date_str[0:2], date_str[3:5], date_str[6:10]
+    if (len(date_str) != 10 or date_str[2] != '/' or date_str[5] != '/'
+            or not (day_str.isdigit() and month_str.isdigit() and year_str.isdigit())):
+        return False, "Formato incorrecto. Use DD/MM/YYYY", None
+
+    try:
+        # Extraer componentes por posición
+        day, month, year = int(day_str), int(month_str), int(year_str)
+
+        # Verificar rangos básicos
+        if not (1 <= day <= 31):
+            return False, f"Día inválido: {day} (debe ser 1-31)", None
+        if not (1 <= month <= 12):
+            return False, f"Mes inválido: {month} (debe ser 1-12)", None
+        if not (1900 <= year <= 2100):
+            return False, f"Año inválido: {year} (debe ser 1900-2100)", None
+
+        # Crear objeto datetime para validación completa; se reutiliza como resultado del parseo
+        return True, "Fecha válida", datetime(year, month, day)
+
+    except ValueError as e:
+        return False, f"Fecha inválida: {str(e)}", None
+
+
+# Claves y cifradores compartidos por todas las instancias del proceso, por ruta absoluta del archivo de clave
+_KEY_CACHE = {}
+_FERNET_CACHE = {}
+
+# Presets predefinidos: clave -> (nombre, descripción, días hacia atrás o None para omitir fechas)
+_PRESET_DEFINITIONS = {
+    'no_dates': ('Sin fechas (por defecto)', 'No modifica las fechas en la página', None),
+    'today': ('Solo hoy', 'Buscar solo registros de hoy', 0),
+    'last_week': ('Última semana', 'Buscar registros de los últimos 7 días', 7),
+    'last_month': ('Último mes', 'Buscar registros de los últimos 30 días', 30),
+    'last_quarter': ('Último trimestre', 'Buscar registros de los últimos 90 días', 90),
+}
+
 
 class DateConfigManager:
     """Gestor de configuración de fechas con encriptación para automatización"""
@@ -37,6 +92,13 @@ class DateConfigManager:
             'format': 'DD/MM/YYYY'
         }
 
+        # Configuración descifrada y (mtime_ns, tamaño) del archivo del que salió
+        self._config_cache = None
+        self._config_cache_stat = None
+
+        # Presets del día: (ordinal de la fecha, diccionario de presets)
+        self._preset_cache = (None, None)
+
     def is_crypto_available(self):
         """Verifica si la encriptación está disponible"""
         return CRYPTO_AVAILABLE
@@ -46,31 +108,43 @@ class DateConfigManager:
         if not CRYPTO_AVAILABLE:
             raise ImportError("cryptography no está disponible")
 
+        cache_key = os.path.abspath(self.key_file)
+        key = _KEY_CACHE.get(cache_key)
+        if key is not None:
+            return key
+
         if os.path.exists(self.key_file):
             with open(self.key_file, 'rb') as f:
-                return f.read()
+                key = f.read()
         else:
             key = Fernet.generate_key()
             with open(self.key_file, 'wb') as f:
                 f.write(key)
-            return key
+
+        _KEY_CACHE[cache_key] = key
+        return key
+
+    def _get_fernet(self):
+        """Obtiene el cifrador Fernet, creándolo una sola vez por proceso"""
+        cache_key = os.path.abspath(self.key_file)
+        fernet = _FERNET_CACHE.get(cache_key)
+        if fernet is None:
+            fernet = _FERNET_CACHE[cache_key] = Fernet(self._get_or_create_key())
+        return fernet
 
     def _clean_string(self, text):
         """Limpia caracteres problemáticos de un string"""
         if not isinstance(text, str):
             return text
-        text = text.replace('\xa0', ' ')
-        text = text.replace('\u00a0', ' ')
-        text = ' '.join(text.split())
-        return text.strip()
+        # split() sin argumentos ya trata '\xa0' como espacio: una sola pasada normaliza y recorta
+        return ' '.join(text.split())
 
     def _encrypt_data(self, data):
         """Encripta los datos de configuración de fechas"""
         if not CRYPTO_AVAILABLE:
             raise ImportError("cryptography no está disponible para encriptar")
 
-        key = self._get_or_create_key()
-        fernet = Fernet(key)
+        fernet = self._get_fernet()
 
         # Limpiar strings en los datos
         clean_data = {}
@@ -80,9 +154,12 @@ class DateConfigManager:
             else:
                 clean_data[key_name] = value
 
-        json_str = json.dumps(clean_data, ensure_ascii=True, default=str)
-        encrypted_data = fernet.encrypt(json_str.encode('utf-8'))
-        return encrypted_data
+        # save_config solo arma valores str, bool o None (tipos JSON nativos): no hace falta default=str
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(clean_data)
+        else:
+            payload = json.dumps(clean_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return fernet.encrypt(payload)
 
     def _decrypt_data(self, encrypted_data):
         """Desencripta los datos de configuración de fechas"""
@@ -90,42 +167,23 @@ class DateConfigManager:
             return None
 
         try:
-            key = self._get_or_create_key()
-            fernet = Fernet(key)
+            fernet = self._get_fernet()
             decrypted_data = fernet.decrypt(encrypted_data)
-            return json.loads(decrypted_data.decode('utf-8'))
+            return orjson.loads(decrypted_data) if ORJSON_AVAILABLE else json.loads(decrypted_data)
         except Exception:
             return None
 
-    def validate_date_format(self, date_str):
-        """Valida que una fecha tenga el formato DD/MM/YYYY correcto"""
+    def _check_date(self, date_str):
+        """Valida una fecha y devuelve (válida, mensaje, datetime o None) en una sola pasada"""
         if not date_str or not isinstance(date_str, str):
-            return False, "Fecha vacía o no es string"
+            return False, "Fecha vacía o no es string", None
 
-        date_str = self._clean_string(date_str)
+        return _validate_date_format_cached(self._clean_string(date_str))
 
-        # Verificar patrón regex
-        if not self.date_pattern.match(date_str):
-            return False, "Formato incorrecto. Use DD/MM/YYYY"
-
-        try:
-            # Extraer componentes
-            day, month, year = map(int, date_str.split('/'))
-
-            # Verificar rangos básicos
-            if not (1 <= day <= 31):
-                return False, f"Día inválido: {day} (debe ser 1-31)"
-            if not (1 <= month <= 12):
-                return False, f"Mes inválido: {month} (debe ser 1-12)"
-            if not (1900 <= year <= 2100):
-                return False, f"Año inválido: {year} (debe ser 1900-2100)"
-
-            # Crear objeto datetime para validación completa
-            datetime(year, month, day)
-            return True, "Fecha válida"
-
-        except ValueError as e:
-            return False, f"Fecha inválida: {str(e)}"
+    def validate_date_format(self, date_str):
+        """Valida que una fecha tenga el formato DD/MM/YYYY correcto"""
+        is_valid, message, _ = self._check_date(date_str)
+        return is_valid, message
 
     def validate_date_range(self, date_from, date_to):
         """Valida que un rango de fechas sea correcto"""
@@ -142,20 +200,17 @@ class DateConfigManager:
             is_valid, message = self.validate_date_format(date_to)
             return is_valid, f"Solo fecha 'Hasta': {message}"
 
-        # Si ambas están llenas, validar ambas y el rango
-        from_valid, from_message = self.validate_date_format(date_from)
+        # Si ambas están llenas, validar ambas y el rango (reutilizando los datetime ya construidos)
+        from_valid, from_message, from_dt = self._check_date(date_from)
         if not from_valid:
             return False, f"Fecha 'Desde' inválida: {from_message}"
 
-        to_valid, to_message = self.validate_date_format(date_to)
+        to_valid, to_message, to_dt = self._check_date(date_to)
         if not to_valid:
             return False, f"Fecha 'Hasta' inválida: {to_message}"
 
         # Validar que 'Desde' no sea posterior a 'Hasta'
         try:
-            from_dt = self.parse_date_string(date_from)
-            to_dt = self.parse_date_string(date_to)
-
             if from_dt > to_dt:
                 return False, "La fecha 'Desde' no puede ser posterior a 'Hasta'"
 
@@ -174,26 +229,32 @@ class DateConfigManager:
         if not date_str:
             return None
 
-        is_valid, message = self.validate_date_format(date_str)
+        is_valid, message, dt = self._check_date(date_str)
         if not is_valid:
             raise ValueError(f"Fecha inválida: {message}")
 
-        day, month, year = map(int, date_str.split('/'))
-        return datetime(year, month, day)
+        return dt
+
+    @staticmethod
+    def _parse_date_only(date_str):
+        """Convierte DD/MM/YYYY a date sin validar el formato (para fechas ya validadas)"""
+        return date(int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2]))
 
     def format_datetime_to_string(self, dt):
         """Convierte objeto datetime a string DD/MM/YYYY"""
         if not dt or not isinstance(dt, datetime):
             return ""
-        return dt.strftime("%d/%m/%Y")
+        # Formato fijo: acceso directo a los campos, sin pasar por strftime
+        return f"{dt.day:02d}/{dt.month:02d}/{dt.year:04d}"
 
     def get_today_string(self):
         """Obtiene la fecha de hoy como string DD/MM/YYYY"""
-        return datetime.now().strftime("%d/%m/%Y")
+        return self.format_datetime_to_string(datetime.now())
 
-    def get_date_range_days_ago(self, days):
-        """Obtiene rango de fechas desde hace X días hasta hoy"""
-        today = datetime.now()
+    def get_date_range_days_ago(self, days, today=None):
+        """Obtiene rango de fechas desde hace X días hasta hoy (today permite reutilizar un now() ya calculado)"""
+        if today is None:
+            today = datetime.now()
         past_date = today - timedelta(days=days)
         return {
             'date_from': self.format_datetime_to_string(past_date),
@@ -205,6 +266,10 @@ class DateConfigManager:
         if not isinstance(config, dict):
             return False, "Configuración debe ser un diccionario"
 
+        return self._validate_config_parsed(config)
+
+    def _validate_config_parsed(self, config):
+        """Valida una configuración que el llamador ya sabe que es un diccionario"""
         # Verificar campos requeridos
         required_fields = ['skip_dates']
         for field in required_fields:
@@ -239,14 +304,18 @@ class DateConfigManager:
                 'skip_dates': config.get('skip_dates', True),
                 'date_from': self._clean_string(config.get('date_from', '')),
                 'date_to': self._clean_string(config.get('date_to', '')),
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': time.strftime('%Y-%m-%dT%H:%M:%S'),
                 'format': 'DD/MM/YYYY'
             }
 
             # Encriptar y guardar
             encrypted_data = self._encrypt_data(config_data)
-            with open(self.config_file, 'wb') as f:
-                f.write(encrypted_data)
+            write_atomic(self.config_file, encrypted_data)
+
+            # Lo recién guardado queda como caché: la siguiente lectura no necesita descifrar
+            stat = os.stat(self.config_file)
+            self._config_cache = config_data
+            self._config_cache_stat = (stat.st_mtime_ns, stat.st_size)
 
             return True, "Configuración de fechas guardada correctamente"
 
@@ -259,13 +328,12 @@ class DateConfigManager:
             return self.default_config.copy()
 
         try:
-            if not os.path.exists(self.config_file):
+            try:
+                stat = os.stat(self.config_file)
+            except FileNotFoundError:
                 return self.default_config.copy()
 
-            with open(self.config_file, 'rb') as f:
-                encrypted_data = f.read()
-
-            config = self._decrypt_data(encrypted_data)
+            config = self._load_config_for(stat)
 
             if not config:
                 return self.default_config.copy()
@@ -280,18 +348,37 @@ class DateConfigManager:
             print(f"Error cargando configuración de fechas: {e}")
             return self.default_config.copy()
 
+    def _load_config_for(self, stat):
+        """Devuelve la configuración del archivo ya consultado con os.stat, descifrando solo si cambió"""
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+        if file_stamp != self._config_cache_stat:
+            with open(self.config_file, 'rb') as f:
+                self._config_cache = self._decrypt_data(f.read())
+            self._config_cache_stat = file_stamp
+
+        return self._config_cache
+
+    def _invalidate_config_cache(self):
+        """Descarta la configuración en memoria tras escribir o borrar el archivo"""
+        self._config_cache = None
+        self._config_cache_stat = None
+
     def clear_config(self):
         """Elimina la configuración guardada y archivos asociados"""
         try:
             files_removed = 0
-
-            if os.path.exists(self.config_file):
-                os.remove(self.config_file)
-                files_removed += 1
-
-            if os.path.exists(self.key_file):
-                os.remove(self.key_file)
-                files_removed += 1
+            for path in (self.config_file, self.key_file):
+                try:
+                    os.remove(path)
+                    files_removed += 1
+                except FileNotFoundError:
+                    pass
+
+            # La clave eliminada ya no debe usarse desde memoria
+            cache_key = os.path.abspath(self.key_file)
+            _KEY_CACHE.pop(cache_key, None)
+            _FERNET_CACHE.pop(cache_key, None)
+            self._invalidate_config_cache()
 
             return True, f"Se eliminaron {files_removed} archivos de configuración de fechas"
 
@@ -301,7 +388,9 @@ class DateConfigManager:
     def get_config_info(self):
         """Obtiene información sobre la configuración guardada sin mostrar datos sensibles"""
         try:
-            if not os.path.exists(self.config_file):
+            try:
+                stat = os.stat(self.config_file)
+            except FileNotFoundError:
                 return {
                     'exists': False,
                     'skip_dates': True,
@@ -311,8 +400,8 @@ class DateConfigManager:
                     'file_size': 0
                 }
 
-            config = self.load_config()
-            file_size = os.path.getsize(self.config_file) if os.path.exists(self.config_file) else 0
+            # Reutiliza el stat ya hecho y la caché en memoria en lugar de recargar el archivo
+            config = (self._load_config_for(stat) if CRYPTO_AVAILABLE else None) or self.default_config
 
             return {
                 'exists': True,
@@ -320,7 +409,7 @@ class DateConfigManager:
                 'has_date_from': bool(config.get('date_from', '')),
                 'has_date_to': bool(config.get('date_to', '')),
                 'last_updated': config.get('last_updated'),
-                'file_size': file_size
+                'file_size': stat.st_size
             }
 
         except Exception as e:
@@ -344,10 +433,8 @@ class DateConfigManager:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = f"backup_date_config_{timestamp}.json"
 
-            # Copiar archivo encriptado
-            with open(self.config_file, 'rb') as source:
-                with open(backup_path, 'wb') as backup:
-                    backup.write(source.read())
+            # Copiar archivo encriptado (copia a nivel de sistema, sin cargarlo en memoria)
+            shutil.copyfile(self.config_file, backup_path)
 
             return True, f"Backup de configuración de fechas creado en: {backup_path}"
 
@@ -357,20 +444,20 @@ class DateConfigManager:
     def restore_config(self, backup_path):
         """Restaura configuración desde un backup"""
         try:
-            if not os.path.exists(backup_path):
+            # Verificar que el backup sea válido (una sola apertura, sin consultar antes si existe)
+            try:
+                with open(backup_path, 'rb') as f:
+                    backup_data = f.read()
+            except FileNotFoundError:
                 return False, "Archivo de backup no encontrado"
 
-            # Verificar que el backup sea válido
-            with open(backup_path, 'rb') as f:
-                backup_data = f.read()
-
             # Intentar desencriptar para validar
             test_config = self._decrypt_data(backup_data)
-            if not test_config:
+            if not test_config or not isinstance(test_config, dict):
                 return False, "Backup inválido o corrupto"
 
             # Validar configuración
-            is_valid, message = self.validate_config(test_config)
+            is_valid, message = self._validate_config_parsed(test_config)
             if not is_valid:
                 return False, f"Backup contiene configuración inválida: {message}"
 
@@ -378,79 +465,53 @@ class DateConfigManager:
             if os.path.exists(self.config_file):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 current_backup = f"current_date_config_backup_{timestamp}.json"
-                with open(self.config_file, 'rb') as current:
-                    with open(current_backup, 'wb') as backup:
-                        backup.write(current.read())
+                shutil.copyfile(self.config_file, current_backup)
 
-            # Restaurar configuración
-            with open(self.config_file, 'wb') as f:
-                f.write(backup_data)
+            # Restaurar configuración; lo ya descifrado queda como caché del nuevo archivo
+            write_atomic(self.config_file, backup_data)
+            stat = os.stat(self.config_file)
+            self._config_cache = test_config
+            self._config_cache_stat = (stat.st_mtime_ns, stat.st_size)
 
             return True, "Configuración de fechas restaurada correctamente"
 
         except Exception as e:
             return False, f"Error restaurando configuración de fechas: {str(e)}"
 
+    def _build_preset(self, preset_name, today):
+        """Construye un único preset a partir de la fecha de hoy ya calculada"""
+        name, description, days = _PRESET_DEFINITIONS[preset_name]
+        if days is None:
+            config = {'skip_dates': True, 'date_from': '', 'date_to': ''}
+        else:
+            config = {'skip_dates': False, **self.get_date_range_days_ago(days, today)}
+        return {'name': name, 'description': description, 'config': config}
+
     def get_preset_configs(self):
         """Obtiene configuraciones predefinidas útiles"""
-        presets = {
-            'no_dates': {
-                'name': 'Sin fechas (por defecto)',
-                'description': 'No modifica las fechas en la página',
-                'config': {
-                    'skip_dates': True,
-                    'date_from': '',
-                    'date_to': ''
-                }
-            },
-            'today': {
-                'name': 'Solo hoy',
-                'description': 'Buscar solo registros de hoy',
-                'config': {
-                    'skip_dates': False,
-                    'date_from': self.get_today_string(),
-                    'date_to': self.get_today_string()
-                }
-            },
-            'last_week': {
-                'name': 'Última semana',
-                'description': 'Buscar registros de los últimos 7 días',
-                'config': {
-                    'skip_dates': False,
-                    **self.get_date_range_days_ago(7)
-                }
-            },
-            'last_month': {
-                'name': 'Último mes',
-                'description': 'Buscar registros de los últimos 30 días',
-                'config': {
-                    'skip_dates': False,
-                    **self.get_date_range_days_ago(30)
-                }
-            },
-            'last_quarter': {
-                'name': 'Último trimestre',
-                'description': 'Buscar registros de los últimos 90 días',
-                'config': {
-                    'skip_dates': False,
-                    **self.get_date_range_days_ago(90)
-                }
-            }
-        }
-        return presets
+        today = datetime.now()
+        today_ord = today.toordinal()
+
+        # Los presets solo dependen de la fecha de hoy: se reconstruyen una vez por día
+        cached_ord, presets = self._preset_cache
+        if cached_ord != today_ord:
+            presets = {preset_name: self._build_preset(preset_name, today) for preset_name in _PRESET_DEFINITIONS}
+            self._preset_cache = (today_ord, presets)
+
+        # Copia para que el llamador pueda modificar el resultado sin alterar la caché
+        return {preset_name: {**preset, 'config': dict(preset['config'])} for preset_name, preset in presets.items()}
 
     def apply_preset(self, preset_name):
         """Aplica una configuración predefinida"""
-        presets = self.get_preset_configs()
-
-        if preset_name not in presets:
+        if preset_name not in _PRESET_DEFINITIONS:
             return False, f"Preset '{preset_name}' no encontrado"
 
-        preset_config = presets[preset_name]['config']
-        success, message = self.save_config(preset_config)
+        # Solo se construye el preset solicitado
+        preset = self._build_preset(preset_name, datetime.now())
+        success, message = self.save_config(preset['config'])
 
         if success:
-            return True, f"Preset '{presets[preset_name]['name']}' aplicado: {message}"
+            return True, f"Preset '{preset['name']}' aplicado: {message}"
         else:
             return False, f"Error aplicando preset: {message}"
 
@@ -476,13 +537,14 @@ class DateConfigManager:
 
                     # Información adicional si hay fechas
                     if config.get('date_from') and config.get('date_to'):
+                        # save_config solo persiste fechas validadas: basta el parseo directo
                         try:
-                            from_dt = self.parse_date_string(config['date_from'])
-                            to_dt = self.parse_date_string(config['date_to'])
-                            diff_days = (to_dt - from_dt).days
+                            from_date = self._parse_date_only(config['date_from'])
+                            to_date = self._parse_date_only(config['date_to'])
+                            diff_days = (to_date - from_date).days
                             f.write(f"Rango: {diff_days} días\n")
-                        except:
-                            pass
+                        except (ValueError, TypeError):
+                            pass  # Archivo manipulado: se omite el rango
 
                 f.write(f"\nÚltima actualización: {config.get('last_updated', 'No disponible')}\n")
                 f.write(f"Formato: {config.get('format', 'DD/MM/YYYY')}\n")
@@ -0,0 +1,26 @@
+# file_utils.py
+# Ubicación: /syncro_bot/gui/components/automation/file_utils.py
+"""
+Utilidades de archivo compartidas por los gestores de configuración de automatización.
+Proporciona escritura atómica para que un fallo a mitad de guardado nunca deje
+un archivo de configuración o credenciales corrupto.
+"""
+
+import os
+
+
+def write_atomic(path, data):
+    """Escribe en un temporal y lo renombra sobre el destino: nunca deja el archivo a medias"""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -8,20 +8,75 @@ serie de equipos, configuración de estado (PENDIENTE/FINALIZADO/FINALIZADO_67_P
 y generar reportes Excel completos con toda la información.
 """
 
-import time
+# Handlers de extracción y exportación (importados una sola vez por módulo)
+try:
+    from .data_extractor import DataExtractor
+    from .excel_exporter import ExcelExporter
+
+    DATA_HANDLERS_AVAILABLE = True
+    DATA_HANDLERS_IMPORT_ERROR = None
+except ImportError as e:
+    DataExtractor = ExcelExporter = None
+    DATA_HANDLERS_AVAILABLE = False
+    DATA_HANDLERS_IMPORT_ERROR = str(e)
+
+
+class StepError(Exception):
+    """Fallo de un paso del flujo; el mensaje es el que se reporta al usuario"""
+
+    def __init__(self, message, level="ERROR"):
+        super().__init__(message)
+        self.level = level
 
 
 class AutomationOrchestrator:
     """Coordinador central con funcionalidad completa de extracción de datos, números de serie y estado configurable"""
 
+    # (clave, prerrequisito, comprobación(orquestador, driver, contexto), mensaje de éxito)
+    _COMPONENT_TESTS = (
+        ('login_fields', None,
+         lambda self, driver, ctx: self.login_handler.check_login_fields_present(driver)[0],
+         "✅ Campos de login: OK"),
+        ('login_process', 'login_fields',
+         lambda self, driver, ctx: self.login_handler.perform_login(driver, ctx['username'], ctx['password'])[0],
+         "✅ Proceso de login: OK"),
+        ('dropdown_fields', 'login_process',
+         lambda self, driver, ctx: self.dropdown_handler.get_current_dropdown_values(driver) is not None,
+         "✅ Campos de dropdown: OK"),
+        ('state_configuration', 'dropdown_fields',
+         lambda self, driver, ctx: ctx['selected_state'] in self._available_states,
+         "✅ Estado configurable: OK"),
+        ('date_fields', 'login_process',
+         lambda self, driver, ctx: self.date_handler.validate_date_fields_present(driver)[0],
+         "✅ Campos de fecha: OK"),
+        ('button_fields', 'login_process',
+         lambda self, driver, ctx: self.button_handler.validate_buttons_present(driver)[0],
+         "✅ Botones: OK"),
+        ('data_extraction', 'login_process',
+         lambda self, driver, ctx: self._test_table_statistics(driver, ctx),
+         "✅ Extracción de datos: OK"),
+        ('serie_extraction', 'data_extraction',
+         lambda self, driver, ctx: ctx['table_stats'].get('serie_extraction_available', False),
+         "✅ Extracción de números de serie: OK"),
+        ('excel_export', 'login_process',
+         lambda self, driver, ctx: self._test_excel_export(),
+         "✅ Exportación Excel con números de serie: OK"),
+    )
+    _COMPONENT_TEST_KEYS = ('driver_setup', 'navigation') + tuple(test[0] for test in _COMPONENT_TESTS)
+
+    # Orden de pasos para automatización parcial y su índice precalculado
+    _STEP_NAMES = ('login', 'first_dropdown', 'remaining_dropdowns', 'dates', 'data_extraction')
+    _STEP_INDEX = {name: index for index, name in enumerate(_STEP_NAMES)}
+
     def __init__(self, web_driver_manager, login_handler, dropdown_handler,
-                 date_handler, button_handler, logger=None):
+                 date_handler, button_handler, logger=None, debug_enabled=None):
         self.web_driver_manager = web_driver_manager
         self.login_handler = login_handler
         self.dropdown_handler = dropdown_handler
         self.date_handler = date_handler
         self.button_handler = button_handler
         self.logger = logger
+        self.debug_enabled = debug_enabled
 
         # Handlers para extracción completa con números de serie
         self.data_extractor = None
@@ -30,29 +85,39 @@ class AutomationOrchestrator:
         # URL objetivo por defecto
         self.target_url = "https://fieldservice.cabletica.com/dispatchFS/"
 
+        # Estados soportados: la lista del handler es estática, se consulta una sola vez
+        self._state_order = self._load_available_states()
+        self._available_states = frozenset(self._state_order)
+
         # Inicializar handlers de datos
         self._initialize_data_handlers()
 
+    def _load_available_states(self):
+        """Obtiene los estados soportados por el dropdown handler con fallback"""
+        try:
+            return tuple(self.dropdown_handler.get_available_states())
+        except Exception:
+            return ('PENDIENTE', 'FINALIZADO', 'FINALIZADO_67_PLUS')
+
     def _initialize_data_handlers(self):
         """Inicializa los handlers de extracción con soporte para números de serie"""
-        try:
-            # Importar y crear handlers de datos actualizados
-            from .data_extractor import DataExtractor
-            from .excel_exporter import ExcelExporter
+        if not DATA_HANDLERS_AVAILABLE:
+            self._log(f"❌ Error importando handlers de datos: {DATA_HANDLERS_IMPORT_ERROR}", "ERROR")
+            self.data_extractor = None
+            self.excel_exporter = None
+            return
 
+        try:
             self.data_extractor = DataExtractor(
                 web_driver_manager=self.web_driver_manager,
-                logger=self._log
+                logger=self._log,
+                debug_enabled=self.debug_enabled
             )
 
             self.excel_exporter = ExcelExporter(logger=self._log)
 
             self._log("🔧 Handlers de extracción con números de serie inicializados")
 
-        except ImportError as e:
-            self._log(f"❌ Error importando handlers de datos: {str(e)}", "ERROR")
-            self.data_extractor = None
-            self.excel_exporter = None
         except Exception as e:
             self._log(f"❌ Error inicializando handlers de datos: {str(e)}", "ERROR")
             self.data_extractor = None
@@ -95,34 +160,38 @@ class AutomationOrchestrator:
                 return False, "Error configurando navegador o navegando a la página"
 
             # PASO 2: LOGIN AUTOMÁTICO
-            login_success, login_message = self._execute_login_flow(driver, username, password)
-            if not login_success:
-                return False, login_message
+            try:
+                self._execute_login_flow(driver, username, password)
+            except StepError as e:
+                return False, str(e)
 
             # PASO 3: PRIMER DROPDOWN Y BOTÓN DE PESTAÑA
-            first_dropdown_success, first_dropdown_message = self._execute_first_dropdown_flow(driver)
-            if not first_dropdown_success:
-                self._log(f"Advertencia en primer dropdown: {first_dropdown_message}", "WARNING")
-                return True, f"Login exitoso. {first_dropdown_message}"
+            try:
+                self._execute_first_dropdown_flow(driver)
+            except StepError as e:
+                self._log(f"Advertencia en primer dropdown: {e}", "WARNING")
+                return True, f"Login exitoso. {e}"
 
             # PASO 4: SEGUNDO Y TERCER DROPDOWN (CON ESTADO CONFIGURABLE)
-            remaining_dropdowns_success, remaining_dropdowns_message = self._execute_remaining_dropdowns_flow(
-                driver, selected_state)
-            if not remaining_dropdowns_success:
-                self._log(f"Advertencia en dropdowns restantes: {remaining_dropdowns_message}", "WARNING")
-                return True, f"Login y primer dropdown completados. {remaining_dropdowns_message}"
+            try:
+                self._execute_remaining_dropdowns_flow(driver, selected_state)
+            except StepError as e:
+                self._log(f"Advertencia en dropdowns restantes: {e}", "WARNING")
+                return True, f"Login y primer dropdown completados. {e}"
 
             # PASO 5: CONFIGURACIÓN DE FECHAS
-            date_success, date_message = self._execute_date_configuration_flow(driver, date_config)
-            if not date_success:
-                self._log(f"Advertencia en configuración de fechas: {date_message}", "WARNING")
-                return True, f"Login y dropdowns completados. {date_message}"
+            try:
+                self._execute_date_configuration_flow(driver, date_config)
+            except StepError as e:
+                self._log(f"Advertencia en configuración de fechas: {e}", "WARNING")
+                return True, f"Login y dropdowns completados. {e}"
 
             # PASO 6: TRIPLE CLIC Y EXTRACCIÓN COMPLETA CON NÚMEROS DE SERIE
-            extraction_success, extraction_message, excel_file = self._execute_complete_data_extraction_flow(driver)
-            if not extraction_success:
-                self._log(f"Error en extracción completa: {extraction_message}", "ERROR")
-                return True, f"Automatización completada pero sin extracción de datos. {extraction_message}"
+            try:
+                excel_file, _, _ = self._execute_complete_data_extraction_flow(driver)
+            except StepError as e:
+                self._log(f"Error en extracción completa: {e}", "ERROR")
+                return True, f"Automatización completada pero sin extracción de datos. {e}"
 
             # ✅ PROCESO COMPLETO EXITOSO CON NÚMEROS DE SERIE Y ESTADO
             final_message = f"🎉 Automatización completa exitosa: Login, dropdowns (Estado: {selected_state}), fechas, extracción con números de serie y Excel generado."
@@ -149,7 +218,7 @@ class AutomationOrchestrator:
             selected_state = state_config.get('selected_state', 'PENDIENTE')
 
             # Validar que el estado sea compatible con el dropdown handler
-            if not self.dropdown_handler.is_state_supported(selected_state):
+            if selected_state not in self._available_states:
                 self._log(f"⚠️ Estado '{selected_state}' no soportado, usando PENDIENTE", "WARNING")
                 return "PENDIENTE"
 
@@ -161,50 +230,47 @@ class AutomationOrchestrator:
             return "PENDIENTE"
 
     def _execute_complete_data_extraction_flow(self, driver):
-        """Ejecuta el flujo completo: triple clic, extracción con números de serie y Excel"""
+        """Ejecuta triple clic, extracción con números de serie y Excel; devuelve (archivo, registros, series)"""
         try:
             self._log("📊 Iniciando flujo completo de extracción con números de serie...")
 
             # Verificar que los handlers estén disponibles
             if not self.data_extractor or not self.excel_exporter:
-                return False, "Handlers de extracción no disponibles", None
+                raise StepError("Handlers de extracción no disponibles")
 
             # Verificar que Excel esté disponible
             if not self.excel_exporter.is_available():
-                return False, "openpyxl no está instalado para crear archivos Excel", None
+                raise StepError("openpyxl no está instalado para crear archivos Excel")
 
             # TRIPLE CLIC en el botón de búsqueda
             self._log("🔘🔘🔘 Ejecutando triple clic en botón de búsqueda...")
             triple_click_success, triple_click_message = self.button_handler.handle_search_button_triple_click(driver)
 
             if not triple_click_success:
-                return False, f"Error en triple clic: {triple_click_message}", None
+                raise StepError(f"Error en triple clic: {triple_click_message}")
 
             self._log(f"✅ Triple clic completado: {triple_click_message}")
 
             # EXTRACCIÓN COMPLETA DE DATOS CON NÚMEROS DE SERIE
             self._log("📋🔢 Extrayendo datos completos incluyendo números de serie (con doble clic)...")
-            extraction_success, extraction_message, extracted_data = self.data_extractor.extract_table_data(driver)
+            rows_found, rows_message, data_rows = self.data_extractor.find_data_rows(driver)
+
+            if not rows_found:
+                raise StepError(f"Error extrayendo datos completos: {rows_message}")
 
-            if not extraction_success:
-                return False, f"Error extrayendo datos completos: {extraction_message}", None
+            # ANÁLISIS DE NÚMEROS DE SERIE mientras llegan los registros (el extractor marca 'serie_ok')
+            extracted_data = []
+            series_extracted = 0
+            for record in self.data_extractor.iter_table_data(driver, data_rows):
+                extracted_data.append(record)
+                series_extracted += record['serie_ok']
+            series_errors = len(extracted_data) - series_extracted
 
             if not extracted_data:
-                return False, "No se extrajeron datos de la tabla", None
+                raise StepError("No se extrajeron datos de la tabla")
 
             self._log(f"✅ Datos completos extraídos: {len(extracted_data)} registros")
 
-            # ANÁLISIS DE NÚMEROS DE SERIE EXTRAÍDOS
-            series_extracted = 0
-            series_errors = 0
-            for record in extracted_data:
-                numero_serie = record.get('numero_serie', '')
-                if numero_serie and numero_serie not in ['Sin número de serie', 'Error en doble clic', 'Campo no encontrado',
-                                           'Error extracción', 'Error popup', 'Campo vacío', 'Sin número de serie', 'Error']:
-                    series_extracted += 1
-                else:
-                    series_errors += 1
-
             self._log(f"🔢 Análisis de números de serie: {series_extracted} extraídos, {series_errors} errores")
 
             # VALIDACIÓN de los datos extraídos
@@ -229,7 +295,7 @@ class AutomationOrchestrator:
             )
 
             if not excel_success:
-                return False, f"Error creando Excel: {excel_message}", None
+                raise StepError(f"Error creando Excel: {excel_message}")
 
             # VALIDACIÓN del archivo Excel
             validation_success, validation_message = self.excel_exporter.validate_excel_file(excel_filepath)
@@ -238,21 +304,22 @@ class AutomationOrchestrator:
             else:
                 self._log(f"⚠️ Advertencia validando Excel: {validation_message}", "WARNING")
 
-            success_message = f"Extracción completa: {len(extracted_data)} registros con {series_extracted} números de serie → {excel_filepath}"
-            return True, success_message, excel_filepath
+            return excel_filepath, len(extracted_data), series_extracted
 
+        except StepError:
+            raise
         except Exception as e:
             error_msg = f"Error en flujo de extracción completa: {str(e)}"
             self._log(error_msg, "ERROR")
-            return False, error_msg, None
+            raise StepError(error_msg) from e
 
-    def _setup_and_navigate(self):
-        """Configura el driver y navega a la página objetivo"""
+    def _setup_and_navigate(self, lean_mode=True):
+        """Configura el driver (en modo ligero por defecto) y navega a la página objetivo"""
         try:
             self._log("🔧 Configurando navegador...")
 
             # Configurar driver
-            driver, success, setup_message = self.web_driver_manager.setup_chrome_driver()
+            driver, success, setup_message = self.web_driver_manager.acquire_driver(lean_mode=lean_mode)
             if not success:
                 self._log(f"❌ Error configurando driver: {setup_message}", "ERROR")
                 return None
@@ -279,41 +346,57 @@ class AutomationOrchestrator:
             return None
 
     def _execute_login_flow(self, driver, username, password):
-        """Ejecuta el flujo completo de login"""
+        """Ejecuta el flujo completo de login; lanza StepError si falla"""
         try:
             self._log("🔐 Iniciando flujo de login...")
 
-            # Verificar si ya estamos logueados
-            already_logged, login_status = self.login_handler.is_already_logged_in(driver)
-            if already_logged:
-                self._log("✅ Usuario ya está logueado")
-                return True, "Usuario ya estaba logueado"
+            # Sonda única: sesión iniciada y campos de login en una sola llamada al driver
+            login_xpaths = self.login_handler.login_xpaths
+            probe = self.web_driver_manager.probe_readiness(
+                dict(login_xpaths, logged_in=self.login_handler.logged_in_xpath))
+            current_url = probe.get('current_url', '')
 
-            # Validar página de login
-            page_valid, page_message = self.login_handler.validate_login_page(driver)
-            if not page_valid:
-                return False, f"Página de login inválida: {page_message}"
+            if probe.get('logged_in') and "login" not in current_url.lower():
+                self._log("✅ Usuario ya está logueado")
+                return
 
-            # Esperar formulario de login
-            form_ready, form_message = self.login_handler.wait_for_login_form(driver)
-            if not form_ready:
-                return False, f"Formulario de login no disponible: {form_message}"
+            form_ready = ("fieldservice.cabletica.com" in current_url and
+                          all(probe.get(key) for key in login_xpaths))
+            if form_ready:
+                self._log("✅ Formulario de login presente")
+            else:
+                # La página aún no terminó de cargar: validar con las esperas de cada handler
+                already_logged, login_status = self.login_handler.is_already_logged_in(driver)
+                if already_logged:
+                    self._log("✅ Usuario ya está logueado")
+                    return
+
+                # Validar página de login
+                page_valid, page_message = self.login_handler.validate_login_page(driver)
+                if not page_valid:
+                    raise StepError(f"Página de login inválida: {page_message}")
+
+                # Esperar formulario de login
+                form_ready, form_message = self.login_handler.wait_for_login_form(driver)
+                if not form_ready:
+                    raise StepError(f"Formulario de login no disponible: {form_message}")
 
             # Realizar login
             login_success, login_message = self.login_handler.perform_login(driver, username, password)
             if not login_success:
-                return False, f"Login fallido: {login_message}"
+                raise StepError(f"Login fallido: {login_message}")
 
             self._log("✅ Login completado exitosamente")
-            return True, login_message
 
+        except StepError:
+            raise
         except Exception as e:
             error_msg = f"Error en flujo de login: {str(e)}"
             self._log(error_msg, "ERROR")
-            return False, error_msg
+            raise StepError(error_msg) from e
 
     def _execute_first_dropdown_flow(self, driver):
-        """Ejecuta el flujo del primer dropdown y botón de pestaña"""
+        """Ejecuta el flujo del primer dropdown y botón de pestaña; lanza StepError si falla"""
         try:
             self._log("🔽 Iniciando flujo de primer dropdown...")
 
@@ -321,24 +404,25 @@ class AutomationOrchestrator:
             first_dropdown_success, first_dropdown_message = self.dropdown_handler.handle_first_dropdown_selection(
                 driver)
             if not first_dropdown_success:
-                return False, first_dropdown_message
+                raise StepError(first_dropdown_message, "WARNING")
 
             # Botón de pestaña después del primer dropdown
             self._log("🔘 Procediendo con botón de pestaña...")
             tab_button_success, tab_button_message = self.button_handler.handle_tab_button_click(driver)
             if not tab_button_success:
-                return False, f"Primer dropdown OK, pero {tab_button_message}"
+                raise StepError(f"Primer dropdown OK, pero {tab_button_message}", "WARNING")
 
             self._log("✅ Primer dropdown y botón de pestaña completados")
-            return True, "Primer dropdown y botón de pestaña ejecutados exitosamente"
 
+        except StepError:
+            raise
         except Exception as e:
             error_msg = f"Error en flujo de primer dropdown: {str(e)}"
             self._log(error_msg, "ERROR")
-            return False, error_msg
+            raise StepError(error_msg) from e
 
     def _execute_remaining_dropdowns_flow(self, driver, selected_state="PENDIENTE"):
-        """🆕 Ejecuta el flujo de segundo y tercer dropdown con estado configurable que afecta ambos dropdowns"""
+        """🆕 Ejecuta el flujo de segundo y tercer dropdown con estado configurable; lanza StepError si falla"""
         try:
             self._log(f"🔽 Iniciando flujo de dropdowns restantes (Estado: {selected_state})...")
 
@@ -346,13 +430,13 @@ class AutomationOrchestrator:
             second_dropdown_success, second_dropdown_message = self.dropdown_handler.handle_second_dropdown_selection(
                 driver, selected_state)
             if not second_dropdown_success:
-                return False, f"Error en segundo dropdown: {second_dropdown_message}"
+                raise StepError(f"Error en segundo dropdown: {second_dropdown_message}", "WARNING")
 
             # Tercer dropdown con estado configurable
             third_dropdown_success, third_dropdown_message = self.dropdown_handler.handle_third_dropdown_selection(
                 driver, selected_state)
             if not third_dropdown_success:
-                return False, f"Segundo dropdown OK, pero error en tercer dropdown: {third_dropdown_message}"
+                raise StepError(f"Segundo dropdown OK, pero error en tercer dropdown: {third_dropdown_message}", "WARNING")
 
             # Validación final de todos los dropdowns con estado esperado
             validation_success, validation_message = self.dropdown_handler.validate_dropdown_selections(
@@ -361,36 +445,55 @@ class AutomationOrchestrator:
                 self._log(f"⚠️ Advertencia en validación: {validation_message}", "WARNING")
 
             self._log(f"✅ Dropdowns restantes completados (Estado: {selected_state})")
-            return True, f"Segundo y tercer dropdown ejecutados exitosamente con estado {selected_state}"
 
+        except StepError:
+            raise
         except Exception as e:
             error_msg = f"Error en flujo de dropdowns restantes: {str(e)}"
             self._log(error_msg, "ERROR")
-            return False, error_msg
+            raise StepError(error_msg) from e
 
     def _execute_date_configuration_flow(self, driver, date_config):
-        """Ejecuta el flujo de configuración de fechas"""
+        """Ejecuta el flujo de configuración de fechas; lanza StepError si falla"""
         try:
             self._log("📅 Iniciando flujo de configuración de fechas...")
 
-            # Verificar si los campos de fecha están presentes
-            fields_present, fields_message = self.date_handler.validate_date_fields_present(driver)
-            if not fields_present:
-                self._log(f"⚠️ Campos de fecha no disponibles: {fields_message}", "WARNING")
-                return True, f"Fechas omitidas: {fields_message}"
+            # Verificar si los campos de fecha están presentes (sonda única, con espera solo si faltan)
+            date_xpaths = self.date_handler.date_field_xpaths
+            probe = self.web_driver_manager.probe_readiness(date_xpaths)
+            if not all(probe.get(key) for key in date_xpaths):
+                fields_present, fields_message = self.date_handler.validate_date_fields_present(driver)
+                if not fields_present:
+                    self._log(f"⚠️ Campos de fecha no disponibles, fechas omitidas: {fields_message}", "WARNING")
+                    return
 
             # Configurar fechas
             date_success, date_message = self.date_handler.handle_date_configuration(driver, date_config)
             if not date_success:
-                return False, f"Error configurando fechas: {date_message}"
+                raise StepError(f"Error configurando fechas: {date_message}", "WARNING")
 
             self._log("✅ Configuración de fechas completada")
-            return True, date_message
 
+        except StepError:
+            raise
         except Exception as e:
             error_msg = f"Error en flujo de fechas: {str(e)}"
             self._log(error_msg, "ERROR")
-            return False, error_msg
+            raise StepError(error_msg) from e
+
+    def _test_table_statistics(self, driver, context):
+        """Prueba la lectura de la tabla y guarda las estadísticas para el test de números de serie"""
+        if not self.data_extractor:
+            return False
+        context['table_stats'] = self.data_extractor.get_table_statistics(driver)
+        return not context['table_stats'].get('error')
+
+    def _test_excel_export(self):
+        """Prueba que el exportador esté disponible y soporte números de serie"""
+        if not self.excel_exporter:
+            return False
+        export_info = self.excel_exporter.get_export_info()
+        return export_info.get('available', False) and export_info.get('serie_support', False)
 
     def test_automation_components(self, username, password, date_config=None, state_config=None):
         """🆕 Prueba todos los componentes incluyendo funcionalidad de números de serie y estado configurable expandido"""
@@ -400,19 +503,8 @@ class AutomationOrchestrator:
             # Procesar configuración de estado
             selected_state = self._process_state_config(state_config)
 
-            results = {
-                'driver_setup': False,
-                'navigation': False,
-                'login_fields': False,
-                'login_process': False,
-                'dropdown_fields': False,
-                'state_configuration': False,
-                'date_fields': False,
-                'button_fields': False,
-                'data_extraction': False,
-                'serie_extraction': False,  # Cambiado de phone_extraction
-                'excel_export': False
-            }
+            results = dict.fromkeys(self._COMPONENT_TEST_KEYS, False)
+            context = {'username': username, 'password': password, 'selected_state': selected_state}
 
             # Test 1: Configurar driver
             driver = self._setup_and_navigate()
@@ -421,64 +513,13 @@ class AutomationOrchestrator:
                 results['navigation'] = True
                 self._log("✅ Driver y navegación: OK")
 
-                # Test 2: Campos de login
-                fields_present, _ = self.login_handler.check_login_fields_present(driver)
-                results['login_fields'] = fields_present
-                if fields_present:
-                    self._log("✅ Campos de login: OK")
-
-                    # Test 3: Proceso de login
-                    login_success, login_message = self.login_handler.perform_login(driver, username, password)
-                    results['login_process'] = login_success
-                    if login_success:
-                        self._log("✅ Proceso de login: OK")
-
-                        # Test 4: Campos de dropdown
-                        dropdown_values = self.dropdown_handler.get_current_dropdown_values(driver)
-                        results['dropdown_fields'] = dropdown_values is not None
-                        if dropdown_values is not None:
-                            self._log("✅ Campos de dropdown: OK")
-
-                            # Test 5: Configuración de estado
-                            available_states = self.dropdown_handler.get_available_states()
-                            state_supported = self.dropdown_handler.is_state_supported(selected_state)
-                            results['state_configuration'] = state_supported
-                            if state_supported:
-                                self._log(f"✅ Estado configurable: OK ({selected_state} soportado)")
-                            else:
-                                self._log(f"⚠️ Estado: {selected_state} no soportado. Disponibles: {available_states}")
-
-                        # Test 6: Campos de fecha
-                        date_fields_present, _ = self.date_handler.validate_date_fields_present(driver)
-                        results['date_fields'] = date_fields_present
-                        if date_fields_present:
-                            self._log("✅ Campos de fecha: OK")
-
-                        # Test 7: Botones
-                        buttons_present, _ = self.button_handler.validate_buttons_present(driver)
-                        results['button_fields'] = buttons_present
-                        if buttons_present:
-                            self._log("✅ Botones: OK")
-
-                        # Test 8: Extracción de datos básica
-                        if self.data_extractor:
-                            stats = self.data_extractor.get_table_statistics(driver)
-                            results['data_extraction'] = not stats.get('error')
-                            if results['data_extraction']:
-                                self._log("✅ Extracción de datos: OK")
-
-                                # Test 9: Funcionalidad de números de serie
-                                results['serie_extraction'] = stats.get('serie_extraction_available', False)  # Cambiado
-                                if results['serie_extraction']:
-                                    self._log("✅ Extracción de números de serie: OK")
-
-                        # Test 10: Exportación Excel
-                        if self.excel_exporter:
-                            export_info = self.excel_exporter.get_export_info()
-                            results['excel_export'] = export_info.get('available', False) and export_info.get(
-                                'serie_support', False)  # Cambiado de phone_support
-                            if results['excel_export']:
-                                self._log("✅ Exportación Excel con números de serie: OK")
+                # Tests 2-10: cada paso solo corre si su prerrequisito pasó
+                for key, requires, check, ok_message in self._COMPONENT_TESTS:
+                    if requires and not results[requires]:
+                        continue
+                    results[key] = bool(check(self, driver, context))
+                    if results[key]:
+                        self._log(ok_message)
 
                 # Limpiar
                 self.web_driver_manager.cleanup_driver()
@@ -498,8 +539,12 @@ class AutomationOrchestrator:
             self._log(error_msg, "ERROR")
             return False, error_msg
 
-    def get_automation_status(self, driver):
-        """Obtiene el estado completo incluyendo funcionalidad de números de serie y estado"""
+    def get_automation_status(self, driver, fields=None):
+        """Obtiene el estado de la automatización; fields limita los bloques consultados
+
+        Bloques disponibles: 'page', 'logged_in', 'dropdowns', 'states', 'dates', 'buttons', 'table', 'export'.
+        Con fields=None se consultan todos.
+        """
         try:
             if not driver or not self.web_driver_manager.is_driver_active():
                 return {
@@ -511,39 +556,42 @@ class AutomationOrchestrator:
 
             status = {
                 'driver_active': True,
-                'current_url': self.web_driver_manager.get_current_url(),
-                'page_title': self.web_driver_manager.get_page_title(),
                 'components_ready': True
             }
 
+            # Estado de la página
+            if fields is None or 'page' in fields:
+                status['current_url'] = self.web_driver_manager.get_current_url()
+                status['page_title'] = self.web_driver_manager.get_page_title()
+
             # Estado de login
-            already_logged, _ = self.login_handler.is_already_logged_in(driver)
-            status['logged_in'] = already_logged
+            if fields is None or 'logged_in' in fields:
+                already_logged, _ = self.login_handler.is_already_logged_in(driver)
+                status['logged_in'] = already_logged
 
             # Estado de dropdowns
-            dropdown_values = self.dropdown_handler.get_current_dropdown_values(driver)
-            status['dropdown_values'] = dropdown_values
+            if fields is None or 'dropdowns' in fields:
+                status['dropdown_values'] = self.dropdown_handler.get_current_dropdown_values(driver)
 
             # Estado de configuración disponible
-            status['available_states'] = self.dropdown_handler.get_available_states()
+            if fields is None or 'states' in fields:
+                status['available_states'] = list(self._state_order)
 
             # Estado de fechas
-            date_values = self.date_handler.get_current_date_values(driver)
-            status['date_values'] = date_values
+            if fields is None or 'dates' in fields:
+                status['date_values'] = self.date_handler.get_current_date_values(driver)
 
             # Estado de botones
-            button_states = self.button_handler.get_button_states(driver)
-            status['button_states'] = button_states
+            if fields is None or 'buttons' in fields:
+                status['button_states'] = self.button_handler.get_button_states(driver)
 
             # Estado de extracción con números de serie
-            if self.data_extractor:
-                table_stats = self.data_extractor.get_table_statistics(driver)
-                status['table_stats'] = table_stats
+            if self.data_extractor and (fields is None or 'table' in fields):
+                status['table_stats'] = self.data_extractor.get_table_statistics(driver)
 
             # Estado de exportación con soporte para números de serie
-            if self.excel_exporter:
-                export_info = self.excel_exporter.get_export_info()
-                status['export_info'] = export_info
+            if self.excel_exporter and (fields is None or 'export' in fields):
+                status['export_info'] = self.excel_exporter.get_export_info()
 
             return status
 
@@ -563,54 +611,41 @@ class AutomationOrchestrator:
             state_config = kwargs.get('state_config')
             selected_state = self._process_state_config(state_config)
 
-            steps = {
-                'login': lambda: self._execute_login_flow(driver, kwargs.get('username'), kwargs.get('password')),
-                'first_dropdown': lambda: self._execute_first_dropdown_flow(driver),
-                'remaining_dropdowns': lambda: self._execute_remaining_dropdowns_flow(driver, selected_state),  # 🆕
-                'dates': lambda: self._execute_date_configuration_flow(driver, kwargs.get('date_config')),
-                'data_extraction': lambda: self._execute_complete_data_extraction_flow(driver)
-            }
-
-            step_order = ['login', 'first_dropdown', 'remaining_dropdowns', 'dates', 'data_extraction']
-
             # Validar pasos
-            if start_step not in step_order or end_step not in step_order:
+            start_index = self._STEP_INDEX.get(start_step)
+            end_index = self._STEP_INDEX.get(end_step)
+            if start_index is None or end_index is None:
                 return False, "Pasos inválidos especificados"
 
-            start_index = step_order.index(start_step)
-            end_index = step_order.index(end_step)
-
             if start_index > end_index:
                 return False, "El paso inicial debe ser anterior al paso final"
 
             # Ejecutar pasos seleccionados
             executed_steps = []
-            for i in range(start_index, end_index + 1):
-                step_name = step_order[i]
-                step_function = steps[step_name]
-
+            for step_name in self._STEP_NAMES[start_index:end_index + 1]:
                 self._log(f"Ejecutando paso: {step_name}")
-
-                if step_name == 'data_extraction':
-                    # Para extracción de datos completa, manejar el retorno especial
-                    success, message, excel_file = step_function()
-                    if success:
-                        executed_steps.append(f"{step_name} (Excel con números de serie: {excel_file})")  # Cambiado
-                    else:
-                        return False, f"Error en paso {step_name}: {message}"
-                elif step_name == 'remaining_dropdowns':
-                    # Para dropdowns restantes, incluir estado en el mensaje
-                    success, message = step_function()
-                    if success:
-                        executed_steps.append(f"{step_name} (Estado: {selected_state})")
+                step_label = step_name
+
+                try:
+                    if step_name == 'data_extraction':
+                        # Para extracción de datos completa, incluir el archivo generado
+                        excel_file, _, _ = self._execute_complete_data_extraction_flow(driver)
+                        step_label = f"{step_name} (Excel con números de serie: {excel_file})"
+                    elif step_name == 'remaining_dropdowns':
+                        # Para dropdowns restantes, incluir estado en el mensaje
+                        self._execute_remaining_dropdowns_flow(driver, selected_state)
+                        step_label = f"{step_name} (Estado: {selected_state})"
+                    elif step_name == 'login':
+                        self._execute_login_flow(driver, kwargs.get('username'), kwargs.get('password'))
+                    elif step_name == 'first_dropdown':
+                        self._execute_first_dropdown_flow(driver)
                     else:
-                        return False, f"Error en paso {step_name}: {message}"
-                else:
-                    success, message = step_function()
-                    if success:
-                        executed_steps.append(step_name)
-                    else:
-                        return False, f"Error en paso {step_name}: {message}"
+                        self._execute_date_configuration_flow(driver, kwargs.get('date_config'))
+                except StepError as e:
+                    self._log(f"Error en paso {step_name}: {e}", e.level)
+                    return False, f"Error en paso {step_name}: {e}"
+
+                executed_steps.append(step_label)
 
             return True, f"Pasos ejecutados exitosamente: {' → '.join(executed_steps)}"
 
@@ -619,11 +654,14 @@ class AutomationOrchestrator:
             self._log(error_msg, "ERROR")
             return False, error_msg
 
-    def cleanup_automation(self):
-        """Limpia todos los recursos de automatización"""
+    def cleanup_automation(self, keep_driver=True):
+        """Limpia los recursos de automatización; con keep_driver el navegador queda listo para reutilizarse"""
         try:
             self._log("🧹 Limpiando recursos de automatización...")
-            self.web_driver_manager.cleanup_driver()
+            if keep_driver:
+                self.web_driver_manager.release_driver()
+            else:
+                self.web_driver_manager.cleanup_driver()
             self._log("✅ Recursos limpiados correctamente")
             return True, "Limpieza completada"
         except Exception as e:
@@ -639,8 +677,12 @@ class AutomationOrchestrator:
             if not self.data_extractor or not self.excel_exporter:
                 return False, "Handlers de extracción no disponibles", None
 
-            return self._execute_complete_data_extraction_flow(driver)
+            excel_file, records_count, series_extracted = self._execute_complete_data_extraction_flow(driver)
+            return True, (f"Extracción completa: {records_count} registros con {series_extracted} "
+                          f"números de serie → {excel_file}"), excel_file
 
+        except StepError as e:
+            return False, str(e), None
         except Exception as e:
             error_msg = f"Error en extracción independiente: {str(e)}"
             self._log(error_msg, "ERROR")
@@ -699,21 +741,17 @@ class AutomationOrchestrator:
 
     def get_supported_states(self):
         """🆕 Obtiene los estados soportados por el dropdown handler"""
-        try:
-            return self.dropdown_handler.get_available_states()
-        except Exception:
-            return ['PENDIENTE', 'FINALIZADO', 'FINALIZADO_67_PLUS']  # Fallback
+        return list(self._state_order)
 
     def test_state_configuration(self, driver, state_config):
         """Prueba que la configuración de estado funcione correctamente"""
         try:
             selected_state = self._process_state_config(state_config)
 
-            if not self.dropdown_handler.is_state_supported(selected_state):
+            if selected_state not in self._available_states:
                 return False, f"Estado '{selected_state}' no es soportado"
 
-            available_states = self.dropdown_handler.get_available_states()
-            return True, f"Estado '{selected_state}' es válido. Disponibles: {', '.join(available_states)}"
+            return True, f"Estado '{selected_state}' es válido. Disponibles: {', '.join(self._state_order)}"
 
         except Exception as e:
             return False, f"Error probando configuración de estado: {str(e)}"
\ No newline at end of file
@@ -7,7 +7,7 @@ en la tabla del popup las filas con "Unidad"="UND" y extrae el número de serie.
 """
 
 import time
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 
 # Importaciones para Selenium
 try:
@@ -25,9 +25,11 @@ except ImportError:
 class DataExtractor:
     """Extractor especializado de datos con funcionalidad para números de serie de equipos"""
 
-    def __init__(self, web_driver_manager, logger=None):
+    def __init__(self, web_driver_manager, logger=None, debug_enabled=None):
         self.web_driver_manager = web_driver_manager
         self.logger = logger
+        # Consulta del nivel del logger dueño: sin ella los mensajes DEBUG se omiten
+        self.debug_enabled = debug_enabled
 
         # XPaths y selectores para la tabla de datos principal
         self.table_selectors = {
@@ -66,43 +68,25 @@ class DataExtractor:
         else:
             print(f"[{level}] {message}")
 
+    def _debug(self, fmt, *args):
+        """Log DEBUG diferido: solo formatea el mensaje si el logger acepta DEBUG"""
+        if self.debug_enabled is not None and self.debug_enabled():
+            self._log(fmt % args, "DEBUG")
+
     def extract_table_data(self, driver) -> tuple[bool, str, List[Dict]]:
         """Extrae todos los datos de la tabla incluyendo números de serie de equipos"""
         try:
             self._log("📊 Iniciando extracción completa de datos (con números de serie)...")
 
-            # Esperar que aparezca la tabla con datos
-            if not self._wait_for_data_table(driver):
-                return False, "Tabla de datos no encontrada o no cargó", []
-
-            # Obtener todas las filas de datos
-            data_rows = self._get_table_rows(driver)
-            if not data_rows:
-                return False, "No se encontraron filas de datos en la tabla", []
-
-            self._log(f"📋 Encontradas {len(data_rows)} filas de datos para extracción con números de serie")
+            rows_found, rows_message, data_rows = self.find_data_rows(driver)
+            if not rows_found:
+                return False, rows_message, []
 
             # Extraer datos de cada fila (INCLUYE NÚMEROS DE SERIE)
-            extracted_data = []
-            for row_index, row_element in enumerate(data_rows):
-                try:
-                    row_data = self._extract_row_data_with_serie(driver, row_element, row_index)
-                    if row_data:
-                        extracted_data.append(row_data)
-                        cliente_nombre = row_data.get('cliente', 'N/A')
-                        numero_serie = row_data.get('numero_serie', 'Sin número de serie')
-                        self._log(f"✅ Fila {row_index + 1} extraída: {cliente_nombre} - Serie: {numero_serie}")
-                    else:
-                        self._log(f"⚠️ Fila {row_index + 1} no pudo ser extraída", "WARNING")
-                except Exception as e:
-                    self._log(f"❌ Error extrayendo fila {row_index + 1}: {str(e)}", "ERROR")
-                    continue
+            extracted_data = list(self.iter_table_data(driver, data_rows))
 
             if extracted_data:
-                series_extracted = sum(1 for record in extracted_data
-                                       if record.get('numero_serie') and
-                                       record.get('numero_serie') not in ['Sin número de serie', 'Error popup',
-                                                                          'Error extracción', 'Campo no encontrado'])
+                series_extracted = sum(record['serie_ok'] for record in extracted_data)
                 success_message = f"Extracción completa: {len(extracted_data)} registros, {series_extracted} números de serie obtenidos"
                 self._log(f"🎉 {success_message}")
                 return True, success_message, extracted_data
@@ -114,6 +98,38 @@ class DataExtractor:
             self._log(error_msg, "ERROR")
             return False, error_msg, []
 
+    def find_data_rows(self, driver) -> tuple[bool, str, List]:
+        """Espera la tabla de resultados y obtiene sus filas de datos válidas"""
+        # Esperar que aparezca la tabla con datos
+        if not self._wait_for_data_table(driver):
+            return False, "Tabla de datos no encontrada o no cargó", []
+
+        # Obtener todas las filas de datos
+        data_rows = self._get_table_rows(driver)
+        if not data_rows:
+            return False, "No se encontraron filas de datos en la tabla", []
+
+        self._log(f"📋 Encontradas {len(data_rows)} filas de datos para extracción con números de serie")
+        return True, f"{len(data_rows)} filas de datos encontradas", data_rows
+
+    def iter_table_data(self, driver, data_rows: List) -> Iterator[Dict]:
+        """Genera cada registro (con número de serie) en cuanto se extrae, sin acumular la lista completa"""
+        for row_index, row_element in enumerate(data_rows):
+            try:
+                row_data = self._extract_row_data_with_serie(driver, row_element, row_index)
+            except Exception as e:
+                self._log(f"❌ Error extrayendo fila {row_index + 1}: {str(e)}", "ERROR")
+                continue
+
+            if not row_data:
+                self._log(f"⚠️ Fila {row_index + 1} no pudo ser extraída", "WARNING")
+                continue
+
+            cliente_nombre = row_data.get('cliente', 'N/A')
+            numero_serie = row_data.get('numero_serie', 'Sin número de serie')
+            self._log(f"✅ Fila {row_index + 1} extraída: {cliente_nombre} - Serie: {numero_serie}")
+            yield row_data
+
     def _extract_row_data_with_serie(self, driver, row_element, row_index: int) -> Optional[Dict]:
         """Extrae datos de una fila incluyendo el número de serie mediante lectura de tabla del popup"""
         try:
@@ -123,8 +139,9 @@ class DataExtractor:
                 return None
 
             # PASO 2: Obtener número de serie mediante lectura de tabla del popup
-            numero_serie = self._extract_serie_from_popup(driver, row_element, row_index)
+            numero_serie, serie_ok = self._extract_serie_from_popup(driver, row_element, row_index)
             row_data['numero_serie'] = numero_serie
+            row_data['serie_ok'] = serie_ok
 
             return row_data
 
@@ -132,8 +149,8 @@ class DataExtractor:
             self._log(f"Error extrayendo datos completos de fila {row_index + 1}: {str(e)}", "ERROR")
             return None
 
-    def _extract_serie_from_popup(self, driver, row_element, row_index: int) -> str:
-        """Extrae el número de serie leyendo la tabla del popup después del doble clic"""
+    def _extract_serie_from_popup(self, driver, row_element, row_index: int) -> tuple[str, bool]:
+        """Extrae el número de serie del popup; el bool indica si es un número real y no un mensaje de error"""
         try:
             self._log(f"🔢 Extrayendo número de serie para fila {row_index + 1}...")
 
@@ -141,7 +158,7 @@ class DataExtractor:
             cliente_cell = self._find_client_cell(row_element)
             if not cliente_cell:
                 self._log(f"⚠️ No se encontró celda de cliente en fila {row_index + 1}", "WARNING")
-                return "Sin celda cliente"
+                return "Sin celda cliente", False
 
             # PASO 2: Hacer scroll a la celda para asegurar visibilidad
             self.web_driver_manager.scroll_to_element(cliente_cell)
@@ -149,20 +166,20 @@ class DataExtractor:
 
             # PASO 3: Ejecutar doble clic
             if not self._perform_double_click(driver, cliente_cell, row_index):
-                return "Error en doble clic"
+                return "Error en doble clic", False
 
             # PASO 4: Esperar que aparezca el popup
             time.sleep(self.serie_extraction_delay)
 
             # PASO 5: Leer tabla del popup y extraer número de serie
-            numero_serie = self._read_serie_from_popup_table(driver, row_index)
+            numero_serie, serie_ok = self._read_serie_from_popup_table(driver, row_index)
 
             # PASO 6: Regresar a la tabla principal
             if not self._return_to_main_table(driver, row_index):
                 self._log(f"⚠️ Advertencia: no se pudo regresar a tabla principal después de fila {row_index + 1}",
                           "WARNING")
 
-            return numero_serie
+            return numero_serie, serie_ok
 
         except Exception as e:
             self._log(f"❌ Error extrayendo número de serie de fila {row_index + 1}: {str(e)}", "ERROR")
@@ -171,9 +188,9 @@ class DataExtractor:
                 self._return_to_main_table(driver, row_index)
             except:
                 pass
-            return "Error extracción"
+            return "Error extracción", False
 
-    def _read_serie_from_popup_table(self, driver, row_index: int) -> str:
+    def _read_serie_from_popup_table(self, driver, row_index: int) -> tuple[str, bool]:
         """Lee la tabla del popup y extrae números de serie donde Unidad='UND' - VERSIÓN SIMPLIFICADA"""
         try:
             self._log(f"📋 Leyendo tabla del popup para fila {row_index + 1}...")
@@ -188,7 +205,7 @@ class DataExtractor:
 
                 if not rows_with_und:
                     self._log(f"❌ No se encontraron filas con 'UND' en popup de fila {row_index + 1}", "WARNING")
-                    return "Sin UND encontrado"
+                    return "Sin UND encontrado", False
 
                 self._log(f"🔍 Encontradas {len(rows_with_und)} filas con 'UND' en popup")
 
@@ -199,8 +216,7 @@ class DataExtractor:
                         cells = row.find_elements(By.TAG_NAME, "td")
 
                         if len(cells) < 9:
-                            self._log(f"⚠️ Fila {fila_idx} tiene solo {len(cells)} celdas, necesita al menos 9",
-                                      "DEBUG")
+                            self._debug("⚠️ Fila %d tiene solo %d celdas, necesita al menos 9", fila_idx, len(cells))
                             continue
 
                         # Verificar que realmente tenga "UND" en alguna celda
@@ -219,21 +235,21 @@ class DataExtractor:
                             # Validar que no esté vacío
                             if numero_serie and numero_serie not in ['', '&nbsp;', 'N/A']:
                                 self._log(f"✅ Número de serie encontrado en fila {fila_idx}: {numero_serie}")
-                                return numero_serie
+                                return numero_serie, True
                             else:
-                                self._log(f"⚠️ Celda 9 vacía en fila {fila_idx}", "DEBUG")
+                                self._debug("⚠️ Celda 9 vacía en fila %d", fila_idx)
 
                         except Exception as e:
-                            self._log(f"❌ Error extrayendo de celda 9 en fila {fila_idx}: {str(e)}", "DEBUG")
+                            self._debug("❌ Error extrayendo de celda 9 en fila %d: %s", fila_idx, e)
                             continue
 
                     except Exception as e:
-                        self._log(f"❌ Error procesando fila {fila_idx}: {str(e)}", "DEBUG")
+                        self._debug("❌ Error procesando fila %d: %s", fila_idx, e)
                         continue
 
                 # Si llegamos aquí, no se encontró número de serie válido
                 self._log(f"⚠️ No se encontró número de serie válido en popup de fila {row_index + 1}", "WARNING")
-                return "Sin número de serie válido"
+                return "Sin número de serie válido", False
 
             except Exception as e:
                 self._log(f"❌ Error buscando filas con UND: {str(e)}", "ERROR")
@@ -246,7 +262,7 @@ class DataExtractor:
                     popup_tables = driver.find_elements(By.XPATH, "//table[contains(@id, 'tableview')]")
 
                     if not popup_tables:
-                        return "Sin tabla en popup"
+                        return "Sin tabla en popup", False
 
                     for table in popup_tables:
                         try:
@@ -263,23 +279,23 @@ class DataExtractor:
                                         if numero_serie and numero_serie not in ['', '&nbsp;', 'N/A']:
                                             self._log(
                                                 f"✅ Número de serie encontrado (método alternativo): {numero_serie}")
-                                            return numero_serie
+                                            return numero_serie, True
                                     except:
                                         continue
 
                         except Exception as table_error:
-                            self._log(f"Error en tabla específica: {str(table_error)}", "DEBUG")
+                            self._debug("Error en tabla específica: %s", table_error)
                             continue
 
-                    return "Sin número de serie (método alternativo)"
+                    return "Sin número de serie (método alternativo)", False
 
                 except Exception as alt_error:
                     self._log(f"❌ Error en método alternativo: {str(alt_error)}", "ERROR")
-                    return "Error método alternativo"
+                    return "Error método alternativo", False
 
         except Exception as e:
             self._log(f"❌ Error leyendo tabla del popup fila {row_index + 1}: {str(e)}", "ERROR")
-            return "Error lectura popup"
+            return "Error lectura popup", False
 
     # ========== MÉTODOS HEREDADOS DEL CÓDIGO ORIGINAL ==========
 
@@ -298,7 +314,8 @@ class DataExtractor:
                 'observaciones': '',
                 'estado': '',
                 'despacho': '',
-                'numero_serie': ''
+                'numero_serie': '',
+                'serie_ok': False
             }
 
             # Extraer cada campo según su columna
@@ -307,7 +324,7 @@ class DataExtractor:
                     cell_value = self._extract_cell_value(row_element, column_id)
                     row_data[field_name] = cell_value
                 except Exception as e:
-                    self._log(f"Error extrayendo {field_name}: {str(e)}", "DEBUG")
+                    self._debug("Error extrayendo %s: %s", field_name, e)
                     row_data[field_name] = ''
 
             # Verificar que al menos tengamos número de orden
@@ -341,7 +358,7 @@ class DataExtractor:
         except NoSuchElementException:
             return None
         except Exception as e:
-            self._log(f"Error buscando celda de cliente: {str(e)}", "DEBUG")
+            self._debug("Error buscando celda de cliente: %s", e)
             return None
 
     def _perform_double_click(self, driver, client_cell, row_index: int) -> bool:
@@ -440,7 +457,7 @@ class DataExtractor:
                     if self._is_valid_data_row(row):
                         data_rows.append(row)
                 except Exception as e:
-                    self._log(f"Error validando fila: {str(e)}", "DEBUG")
+                    self._debug("Error validando fila: %s", e)
                     continue
 
             self._log(f"📊 {len(data_rows)} filas válidas encontradas de {len(rows)} totales")
@@ -489,7 +506,7 @@ class DataExtractor:
             # La celda no existe o está oculta
             return ''
         except Exception as e:
-            self._log(f"Error extrayendo celda {column_id}: {str(e)}", "DEBUG")
+            self._debug("Error extrayendo celda %s: %s", column_id, e)
             return ''
 
     def _clean_cell_text(self, text: str) -> str:
@@ -528,10 +545,7 @@ class DataExtractor:
             series_extracted = 0
             series_errors = 0
             for record in valid_records:
-                numero_serie = record.get('numero_serie', '')
-                if numero_serie and numero_serie not in ['Sin número de serie', 'Error extracción', 'Error popup',
-                                                         'Error lectura popup', 'Sin tabla popup',
-                                                         'Campo no encontrado']:
+                if record.get('serie_ok'):
                     series_extracted += 1
                 else:
                     series_errors += 1
@@ -540,7 +554,7 @@ class DataExtractor:
             fields_with_data = set()
             for record in valid_records:
                 for field, value in record.items():
-                    if value and field != 'fila_numero':
+                    if value and field not in ('fila_numero', 'serie_ok'):
                         fields_with_data.add(field)
 
             # Contar por tipo de técnico
@@ -597,8 +611,7 @@ class DataExtractor:
                     record_issues.append("Falta información de distrito")
 
                 # Validar número de serie (advertencia, no error crítico)
-                numero_serie = record.get('numero_serie', '')
-                if not numero_serie or numero_serie in ['Sin número de serie', 'Error extracción', 'Error popup']:
+                if not record.get('serie_ok'):
                     record_issues.append("Sin número de serie extraído")
 
                 if record_issues:
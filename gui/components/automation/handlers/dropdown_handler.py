@@ -20,6 +20,17 @@ try:
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+# Lee el valor de varios inputs (por XPath) en una sola llamada; null si el input no existe
+_READ_INPUT_VALUES_SCRIPT = """
+var xpaths = arguments[0];
+var values = {};
+for (var key in xpaths) {
+    var node = document.evaluate(xpaths[key], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    values[key] = node ? node.value : null;
+}
+return values;
+"""
 
 class DropdownHandler:
     """Gestor especializado de los tres dropdowns de automatización con segundo dropdown configurable"""
@@ -525,37 +536,21 @@ class DropdownHandler:
             return False, error_msg
 
     def get_current_dropdown_values(self, driver):
-        """Obtiene los valores actuales de los tres dropdowns"""
+        """Obtiene los valores actuales de los tres dropdowns con una sola llamada al navegador"""
         try:
-            values = {}
-
-            # Primer dropdown
-            try:
-                first_input = driver.find_element(By.XPATH, self.first_dropdown_xpaths['input'])
-                values['first_dropdown'] = first_input.get_attribute('value')
-                self._log(f"Valor actual primer dropdown: '{values['first_dropdown']}'")
-            except Exception as e:
-                self._log(f"Error obteniendo valor del primer dropdown: {e}", "WARNING")
-                values['first_dropdown'] = None
-
-            # Segundo dropdown
-            try:
-                second_input = driver.find_element(By.XPATH, self.second_dropdown_xpaths['input'])
-                values['second_dropdown'] = second_input.get_attribute('value')
-                self._log(f"Valor actual segundo dropdown: '{values['second_dropdown']}'")
-            except Exception as e:
-                self._log(f"Error obteniendo valor del segundo dropdown: {e}", "WARNING")
-                values['second_dropdown'] = None
+            input_xpaths = {
+                'first_dropdown': self.first_dropdown_xpaths['input'],
+                'second_dropdown': self.second_dropdown_xpaths['input'],
+                'third_dropdown': self.third_dropdown_xpaths['input']
+            }
+            values = driver.execute_script(_READ_INPUT_VALUES_SCRIPT, input_xpaths) or {}
 
-            # Tercer dropdown
-            try:
-                third_input = driver.find_element(By.XPATH, self.third_dropdown_xpaths['input'])
-                values['third_dropdown'] = third_input.get_attribute('value')
-                self._log(f"Valor actual tercer dropdown: '{values['third_dropdown']}'")
-            except Exception as e:
-                self._log(f"Error obteniendo valor del tercer dropdown: {e}", "WARNING")
-                values['third_dropdown'] = None
+            for key in input_xpaths:
+                values.setdefault(key, None)
+                if values[key] is None:
+                    self._log(f"Error obteniendo valor de {key}: input no encontrado", "WARNING")
 
+            self._log(f"Valores actuales de dropdowns: {values}")
             return values
         except Exception as e:
             self._log(f"Error obteniendo valores de dropdowns: {e}", "WARNING")
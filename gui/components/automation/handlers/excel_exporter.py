@@ -7,15 +7,18 @@ formato profesional incluyendo todas las columnas extraídas.
 """
 
 import os
+import warnings
 from datetime import datetime
 from typing import List, Dict, Optional
 
 # Importaciones para Excel
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
     from openpyxl.utils import get_column_letter
-    from openpyxl.worksheet.table import Table, TableStyleInfo
+    from openpyxl.worksheet.filters import AutoFilter
+    from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
 
     OPENPYXL_AVAILABLE = True
 except ImportError:
@@ -112,10 +115,9 @@ class ExcelExporter:
 
             self._log(f"📊 Iniciando exportación a Excel uniforme: {filepath}")
 
-            # Crear workbook y worksheet
-            workbook = openpyxl.Workbook()
-            worksheet = workbook.active
-            worksheet.title = "Datos Extraídos"
+            # Crear workbook en modo streaming (write_only): las filas se escriben sin mantener el DOM en memoria
+            workbook = openpyxl.Workbook(write_only=True)
+            worksheet = workbook.create_sheet("Datos Extraídos")
 
             # Configurar datos para exportación
             success = self._setup_worksheet(worksheet, data)
@@ -153,26 +155,23 @@ class ExcelExporter:
                 self._log("❌ ERROR: No se determinaron columnas para incluir", "ERROR")
                 return False
 
+            # Ajustar ancho de columnas (en modo write_only debe hacerse antes de la primera fila)
+            self._adjust_column_widths(worksheet, columns_to_include)
+
             # Crear headers
             self._create_headers(worksheet, columns_to_include)
 
-            # Insertar datos
+            # Insertar datos (bordes y alineación se aplican al escribir cada celda)
             rows_inserted = self._insert_data_improved(worksheet, data, columns_to_include)
             self._log(f"📊 {rows_inserted} filas de datos insertadas en Excel")
 
             if rows_inserted == 0:
                 self._log("⚠️ WARNING: No se insertaron datos en el Excel", "WARNING")
 
-            # Aplicar formato
-            self._apply_formatting(worksheet, len(data), len(columns_to_include))
-
             # Crear tabla solo si hay datos
             if rows_inserted > 0:
                 self._create_table(worksheet, rows_inserted, columns_to_include)
 
-            # Ajustar ancho de columnas (incluyendo número de serie y fecha)
-            self._adjust_column_widths(worksheet, columns_to_include)
-
             return True
 
         except Exception as e:
@@ -280,25 +279,25 @@ class ExcelExporter:
         """Crea los headers del Excel con formato uniforme"""
         self._log(f"📋 Creando headers uniformes para {len(columns)} columnas")
 
+        # 🎨 Estilo uniforme para todos los headers
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")  # Azul uniforme
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        header_border = self._thin_border()
+
+        header_cells = []
         for col_index, column in enumerate(columns, 1):
-            cell = worksheet.cell(row=1, column=col_index)
             header_text = self.column_headers.get(column, column.title())
-            cell.value = header_text
-
-            # 🎨 Estilo uniforme para todos los headers
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")  # Azul uniforme
-
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin")
-            )
+            cell = WriteOnlyCell(worksheet, value=header_text)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            cell.border = header_border
+            header_cells.append(cell)
 
             self._log(f"📋 Header uniforme {col_index}: '{header_text}' para columna '{column}'")
 
+        worksheet.append(header_cells)
         self._log("📋 Headers uniformes creados exitosamente")
 
     def _insert_data_improved(self, worksheet, data: List[Dict], columns: List[str]) -> int:
@@ -307,12 +306,15 @@ class ExcelExporter:
 
         rows_inserted = 0
 
+        # Formato de celdas de datos, compartido por todas las filas
+        thin_border = self._thin_border()
+        data_alignment = Alignment(horizontal="left", vertical="center")
+
         for row_index, record in enumerate(data, 2):  # Empezar en fila 2
             row_has_data = False
+            row_cells = []
 
-            for col_index, column in enumerate(columns, 1):
-                cell = worksheet.cell(row=row_index, column=col_index)
-
+            for column in columns:
                 # Obtener valor del registro
                 raw_value = record.get(column, '')
 
@@ -324,8 +326,11 @@ class ExcelExporter:
                 else:
                     processed_value = self._process_cell_value(raw_value)
 
-                # Asignar valor a la celda
-                cell.value = processed_value
+                # Crear la celda con su valor y formato
+                cell = WriteOnlyCell(worksheet, value=processed_value)
+                cell.border = thin_border
+                cell.alignment = data_alignment
+                row_cells.append(cell)
 
                 # Verificar si esta fila tiene al menos un dato significativo
                 if processed_value and str(processed_value).strip():
@@ -340,6 +345,8 @@ class ExcelExporter:
                     elif column in ['numero_orden', 'cliente']:
                         self._log(f"🔍 DEBUG: Fila {row_index}, {column}: '{raw_value}' → '{processed_value}'")
 
+            worksheet.append(row_cells)
+
             if row_has_data:
                 rows_inserted += 1
             else:
@@ -417,28 +424,15 @@ class ExcelExporter:
 
         return cleaned_value if cleaned_value else ""
 
-    def _apply_formatting(self, worksheet, num_rows: int, num_cols: int):
-        """Aplica formato general al worksheet"""
-        # Borders para todas las celdas con datos
-        thin_border = Border(
+    def _thin_border(self):
+        """Crea el borde fino uniforme usado en headers y celdas de datos"""
+        return Border(
             left=Side(style="thin"),
             right=Side(style="thin"),
             top=Side(style="thin"),
             bottom=Side(style="thin")
         )
 
-        # Aplicar bordes y alineación a todas las celdas con datos
-        for row in range(1, num_rows + 2):  # +2 porque empezamos en 1 y agregamos header
-            for col in range(1, num_cols + 1):
-                cell = worksheet.cell(row=row, column=col)
-                cell.border = thin_border
-
-                # Alineación para celdas de datos (no headers)
-                if row > 1:
-                    cell.alignment = Alignment(horizontal="left", vertical="center")
-
-        self._log("🎨 Formato aplicado exitosamente")
-
     def _create_table(self, worksheet, num_rows: int, columns: List[str]):
         """Crea una tabla de Excel para mejor visualización"""
         try:
@@ -453,8 +447,12 @@ class ExcelExporter:
 
             self._log(f"📋 Creando tabla Excel en rango: {table_range}")
 
-            # Crear tabla
-            table = Table(displayName="DatosExtraidos", ref=table_range)
+            # Crear tabla (en modo write_only columnas y filtro se declaran a mano, con los textos de los headers)
+            table = Table(displayName="DatosExtraidos", ref=table_range, autoFilter=AutoFilter(ref=table_range))
+            table.tableColumns = [
+                TableColumn(id=col_index, name=self.column_headers.get(column, column.title()))
+                for col_index, column in enumerate(columns, 1)
+            ]
 
             # Estilo de tabla
             style = TableStyleInfo(
@@ -466,8 +464,10 @@ class ExcelExporter:
             )
             table.tableStyleInfo = style
 
-            # Agregar tabla al worksheet
-            worksheet.add_table(table)
+            # Agregar tabla al worksheet (el aviso de write_only sobre columnas ya está resuelto arriba)
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)
+                worksheet.add_table(table)
             self._log("📋 Tabla de Excel creada exitosamente")
 
         except Exception as e:
@@ -515,12 +515,18 @@ class ExcelExporter:
         try:
             summary_sheet = workbook.create_sheet("Resumen")
 
+            # Ajustar anchos (en modo write_only debe hacerse antes de la primera fila)
+            summary_sheet.column_dimensions['A'].width = 25
+            summary_sheet.column_dimensions['B'].width = 30
+
             # Título
-            summary_sheet['A1'] = "Resumen de Extracción de Datos"
-            summary_sheet['A1'].font = Font(size=16, bold=True)
+            title_cell = WriteOnlyCell(summary_sheet, value="Resumen de Extracción de Datos")
+            title_cell.font = Font(size=16, bold=True)
+            summary_sheet.append([title_cell])
+            summary_sheet.append([])
 
             # Información general
-            row = 3
+            label_font = Font(bold=True)
             info_items = [
                 ("Fecha de extracción:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
                 ("Total de registros:", len(data)),
@@ -533,40 +539,33 @@ class ExcelExporter:
             ]
 
             for label, value in info_items:
-                summary_sheet[f'A{row}'] = label
-                summary_sheet[f'A{row}'].font = Font(bold=True)
+                label_cell = WriteOnlyCell(summary_sheet, value=label)
+                label_cell.font = label_font
 
                 # 🎨 Sin colores especiales - formato uniforme
-                summary_sheet[f'B{row}'] = value
-                row += 1
+                summary_sheet.append([label_cell, value])
 
             # Estadísticas de tasa de éxito
             if summary_info.get('series_extracted', 0) > 0:  # Cambiado
-                row += 1
-                summary_sheet[f'A{row}'] = "Tasa de éxito de números de serie:"  # Cambiado
-                summary_sheet[f'A{row}'].font = Font(bold=True)
+                summary_sheet.append([])
+                label_cell = WriteOnlyCell(summary_sheet, value="Tasa de éxito de números de serie:")  # Cambiado
+                label_cell.font = label_font
 
                 total_attempts = summary_info.get('series_extracted', 0) + summary_info.get('series_errors', 0)  # Cambiado
                 success_rate = (
                         summary_info.get('series_extracted', 0) / total_attempts * 100) if total_attempts > 0 else 0  # Cambiado
-                summary_sheet[f'B{row}'] = f"{success_rate:.1f}%"
-                row += 1
+                summary_sheet.append([label_cell, f"{success_rate:.1f}%"])
 
             # Estadísticas por técnico si están disponibles
             if 'tecnicos_count' in summary_info:
-                row += 2
-                summary_sheet[f'A{row}'] = "Distribución por Técnico:"
-                summary_sheet[f'A{row}'].font = Font(bold=True)
-                row += 1
+                summary_sheet.append([])
+                summary_sheet.append([])
+                label_cell = WriteOnlyCell(summary_sheet, value="Distribución por Técnico:")
+                label_cell.font = label_font
+                summary_sheet.append([label_cell])
 
                 for tecnico, count in summary_info['tecnicos_count'].items():
-                    summary_sheet[f'A{row}'] = tecnico
-                    summary_sheet[f'B{row}'] = count
-                    row += 1
-
-            # Ajustar anchos
-            summary_sheet.column_dimensions['A'].width = 25
-            summary_sheet.column_dimensions['B'].width = 30
+                    summary_sheet.append([tecnico, count])
 
             self._log("📊 Hoja de resumen con formato uniforme creada")
 
@@ -614,12 +613,11 @@ class ExcelExporter:
 
             filepath = os.path.join(self.output_directory, filename)
 
-            # Crear workbook
-            workbook = openpyxl.Workbook()
+            # Crear workbook en modo streaming (write_only): las filas se escriben sin mantener el DOM en memoria
+            workbook = openpyxl.Workbook(write_only=True)
 
             # Hoja de datos principal
-            main_sheet = workbook.active
-            main_sheet.title = "Datos Extraídos"
+            main_sheet = workbook.create_sheet("Datos Extraídos")
             setup_success = self._setup_worksheet(main_sheet, data)
 
             if not setup_success:
@@ -34,6 +34,9 @@ class LoginHandler:
             'login_button': '//*[@id="button-1041-btnEl"]'
         }
 
+        # Elemento que solo existe con sesión iniciada (dropdown principal)
+        self.logged_in_xpath = "//*[@id='combo-1077-trigger-picker']"
+
         # Configuración de timeouts específicos para login
         self.element_wait_timeout = 25
         self.login_response_timeout = 8
@@ -367,7 +370,7 @@ class LoginHandler:
                 # Verificar si hay elementos que indiquen que estamos logueados
                 try:
                     WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.XPATH, "//*[@id='combo-1077-trigger-picker']"))
+                        EC.presence_of_element_located((By.XPATH, self.logged_in_xpath))
                     )
                     self._log("Usuario ya está logueado")
                     return True, "Ya está logueado"
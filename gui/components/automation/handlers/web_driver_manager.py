@@ -8,6 +8,29 @@ del driver de Selenium con opciones optimizadas y robustas.
 
 import time
 
+# Evalúa todos los XPaths en una sola llamada y devuelve qué elementos existen
+_PROBE_READINESS_SCRIPT = """
+var xpaths = arguments[0];
+var result = {current_url: window.location.href};
+for (var key in xpaths) {
+    result[key] = document.evaluate(xpaths[key], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+}
+return result;
+"""
+
+# Preferencias de Chrome para modo ligero: sin imágenes ni notificaciones
+_LEAN_MODE_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# Dominios de analítica bloqueados vía CDP en modo ligero
+_LEAN_MODE_BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+]
 # Importaciones para Selenium
 try:
     from selenium import webdriver
@@ -26,6 +49,10 @@ class WebDriverManager:
         self.driver = None
         self.logger = logger
 
+        # Modo y ventana principal con que se creó el driver actual, para decidir si se puede reutilizar
+        self._driver_lean_mode = None
+        self._main_handle = None
+
         # Configuración de timeouts
         self.page_load_timeout = 30
         self.implicit_wait_timeout = 10
@@ -41,8 +68,8 @@ class WebDriverManager:
         """Verifica si Selenium está disponible"""
         return SELENIUM_AVAILABLE
 
-    def setup_chrome_driver(self):
-        """Configura el driver de Chrome con opciones optimizadas y robustas"""
+    def setup_chrome_driver(self, lean_mode=False):
+        """Configura el driver de Chrome; lean_mode evita descargar imágenes y analítica"""
         try:
             self._log("Configurando Chrome driver...")
             chrome_options = Options()
@@ -63,6 +90,14 @@ class WebDriverManager:
             # Configurar timeouts más largos
             chrome_options.add_argument("--page-load-strategy=normal")
 
+            # Modo ligero: la extracción no necesita imágenes ni tráfico de fondo
+            if lean_mode:
+                chrome_options.add_experimental_option("prefs", _LEAN_MODE_PREFS)
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_argument("--disable-background-networking")
+                chrome_options.add_argument("--disable-renderer-backgrounding")
+                chrome_options.add_argument("--disable-features=TranslateUI")
+
             # Crear driver con timeouts personalizados
             self._log("Creando instancia de Chrome driver...")
             driver = webdriver.Chrome(options=chrome_options)
@@ -74,8 +109,13 @@ class WebDriverManager:
             # Script anti-detección
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
+            if lean_mode:
+                self._block_tracking_urls(driver)
+
             self._log("Chrome driver configurado exitosamente")
             self.driver = driver
+            self._driver_lean_mode = lean_mode
+            self._main_handle = driver.current_window_handle
             return driver, True, "Driver de Chrome configurado correctamente"
 
         except WebDriverException as e:
@@ -94,6 +134,61 @@ class WebDriverManager:
             self._log(f"Error general: {str(e)}", "ERROR")
             return None, False, f"Error inesperado con Selenium: {str(e)}"
 
+    def _block_tracking_urls(self, driver):
+        """Bloquea dominios de analítica mediante Chrome DevTools Protocol"""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _LEAN_MODE_BLOCKED_URLS})
+            self._log("Modo ligero: imágenes y analítica bloqueadas")
+        except Exception as e:
+            self._log(f"No se pudieron bloquear URLs de analítica: {e}", "WARNING")
+
+    def acquire_driver(self, lean_mode=False):
+        """Reutiliza la sesión de Chrome de la ejecución anterior si sigue viva; si no, crea una nueva"""
+        if self.is_driver_active():
+            if self._driver_lean_mode != lean_mode:
+                # Las opciones de Chrome solo se aplican al arrancar: otro modo exige un navegador nuevo
+                self._log("Modo del navegador distinto al solicitado, reiniciando Chrome")
+                self.cleanup_driver()
+            else:
+                try:
+                    # Reiniciar la sesión sin cerrar el navegador: cerrar popups y volver a la ventana principal
+                    self._close_extra_windows()
+                    self.driver.delete_all_cookies()
+                    self._log("Reutilizando navegador ya iniciado")
+                    return self.driver, True, "Driver de Chrome reutilizado"
+                except Exception as e:
+                    self._log(f"No se pudo reutilizar el navegador: {e}", "WARNING")
+                    self.cleanup_driver()
+
+        return self.setup_chrome_driver(lean_mode=lean_mode)
+
+    def _close_extra_windows(self):
+        """Cierra las ventanas abiertas por la ejecución anterior y vuelve a la principal"""
+        handles = self.driver.window_handles
+        if self._main_handle not in handles:
+            raise RuntimeError("la ventana principal ya no existe")
+
+        for handle in handles:
+            if handle != self._main_handle:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(self._main_handle)
+
+    def release_driver(self, driver=None):
+        """Devuelve el driver: se conserva para la próxima ejecución o se cierra si ya no responde"""
+        if driver is not None and driver is not self.driver:
+            try:
+                driver.quit()
+            except Exception as e:
+                self._log(f"Error cerrando driver ajeno: {e}", "WARNING")
+            return
+
+        if self.is_driver_active():
+            self._log("Navegador conservado para la próxima ejecución")
+        else:
+            self.cleanup_driver()
+
     def cleanup_driver(self):
         """Limpia el driver de Selenium"""
         try:
@@ -101,6 +196,8 @@ class WebDriverManager:
                 self._log("Cerrando navegador...")
                 self.driver.quit()
                 self.driver = None
+                self._driver_lean_mode = None
+                self._main_handle = None
                 self._log("Navegador cerrado correctamente")
         except Exception as e:
             self._log(f"Error limpiando driver: {e}", "WARNING")
@@ -156,6 +253,17 @@ class WebDriverManager:
             self._log(error_msg, "ERROR")
             return False, error_msg
 
+    def probe_readiness(self, xpaths):
+        """Comprueba varios XPaths con un único execute_script; devuelve {clave: bool} más 'current_url'"""
+        if not self.driver:
+            return {}
+
+        try:
+            return self.driver.execute_script(_PROBE_READINESS_SCRIPT, xpaths) or {}
+        except Exception as e:
+            self._log(f"Error en sonda de elementos: {e}", "WARNING")
+            return {}
+
     def scroll_to_element(self, element):
         """Hace scroll a un elemento específico"""
         if not self.driver:
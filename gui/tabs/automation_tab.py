@@ -9,6 +9,7 @@ Incluye extracción de números de serie de equipos mediante lectura de tablas H
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import threading
 from datetime import datetime
 
@@ -40,10 +41,18 @@ class AutomationTab:
         # Componentes UI
         self.ui_components = {}
         self.section_frames = {}
+        self.section_cache = None
 
         # Estado de secciones
         self.expanded_section = None
 
+        # Paneles (los de construcción diferida se crean al expandir su sección)
+        self.status_panel = None
+        self.control_panel = None
+        self.log_panel = None
+        self.state_var = None
+        self.state_form_fonts = None
+
         # Variables para registro de ejecuciones
         self.current_execution_record = None
         self.execution_start_time = None
@@ -65,7 +74,8 @@ class AutomationTab:
         )
 
         # Crear servicio de automatización con logger
-        self.automation_service = AutomationService(logger=self._log_message)
+        self.automation_service = AutomationService(logger=self._log_message,
+                                                    debug_enabled=self.logger.is_debug_enabled)
 
     def set_registry_tab(self, registry_tab):
         """Establece la referencia al RegistroTab para logging"""
@@ -108,6 +118,9 @@ class AutomationTab:
         left_column.grid_rowconfigure(5, weight=1)  # Espaciador
         left_column.grid_columnconfigure(0, weight=1)
 
+        # Caché de secciones para reutilizar frames en reconstrucciones
+        self.section_cache = AutomationUIFactory.create_section_cache(left_column)
+
         # Crear secciones usando componentes modulares
         self._create_credentials_section(left_column)
         self._create_date_config_section(left_column)
@@ -134,10 +147,14 @@ class AutomationTab:
         # Configurar comando de limpiar log
         log_component.set_clear_command(self._clear_log)
 
+        # Guardar referencia al panel para escribir líneas con color
+        self.log_panel = log_component
+
     def _create_credentials_section(self, parent):
         """Crea sección de credenciales usando componentes modulares"""
         section = AutomationUIFactory.create_collapsible_section(
-            parent, "credentials", "🔐 Credenciales de Login", self.theme
+            parent, "credentials", "🔐 Credenciales de Login", self.theme,
+            cache=self.section_cache
         )
         content = section.create(row=0, min_height=200, default_expanded=True)
         section.set_toggle_callback(self._on_section_toggle)
@@ -156,38 +173,50 @@ class AutomationTab:
     def _create_date_config_section(self, parent):
         """Crea sección de configuración de fechas usando componentes modulares"""
         section = AutomationUIFactory.create_collapsible_section(
-            parent, "date_config", "📅 Configuración de Fechas", self.theme
+            parent, "date_config", "📅 Configuración de Fechas", self.theme,
+            cache=self.section_cache
         )
-        content = section.create(row=1, min_height=220, default_expanded=False)  # Cerrada por defecto
+        content = section.create(row=1, min_height=220, default_expanded=False,  # Cerrada por defecto
+                                 builder=self._create_date_config_form)
         section.set_toggle_callback(self._on_section_toggle)
         self.section_frames["date_config"] = section
 
-        # Crear formulario de configuración de fechas
-        date_config_form = AutomationUIFactory.create_date_config_form(content, self.theme)
-        date_config_widgets = date_config_form.create()
+        # El formulario existe desde el inicio (guarda la configuración); sus widgets se crean al expandir
+        self.date_config_form = AutomationUIFactory.create_date_config_form(content, self.theme)
+
+    def _create_date_config_form(self, content):
+        """Construye el formulario de fechas la primera vez que se expande su sección"""
+        date_config_widgets = self.date_config_form.create()
         self.ui_components.update(date_config_widgets)
 
         # Configurar comandos de botones
-        date_config_form.set_button_command('set_today_button', self._set_today_dates)
-        date_config_form.set_button_command('clear_dates_button', self._clear_dates)
-
-        # Guardar referencia al formulario para métodos específicos
-        self.date_config_form = date_config_form
+        self.date_config_form.set_button_command('set_today_button', self._set_today_dates)
+        self.date_config_form.set_button_command('clear_dates_button', self._clear_dates)
 
     def _create_state_config_section(self, parent):
         """🆕 Crea sección de configuración de estado expandida usando componentes modulares"""
         section = AutomationUIFactory.create_collapsible_section(
-            parent, "state_config", "📋 Configuración de Estado", self.theme
+            parent, "state_config", "📋 Configuración de Estado", self.theme,
+            cache=self.section_cache
         )
-        content = section.create(row=2, min_height=220, default_expanded=False)
+        # La variable de estado existe desde el inicio; el formulario se construye al expandir
+        self.state_var = tk.StringVar(value="PENDIENTE")
+        self.ui_components['state_var'] = self.state_var
+
+        section.create(row=2, min_height=220, default_expanded=False,
+                       builder=self._create_state_config_form)
         section.set_toggle_callback(self._on_section_toggle)
         self.section_frames["state_config"] = section
 
-        # Crear formulario de configuración de estado
-        self._create_state_config_form(content)
-
     def _create_state_config_form(self, parent):
         """🆕 Crea el formulario de configuración de estado personalizado con 3 opciones"""
+        # Fuentes compartidas por los widgets del formulario (se guardan para que Tk no las libere)
+        self.state_form_fonts = fonts = {
+            'title': tkfont.Font(family='Segoe UI', size=10, weight='bold'),
+            'option': tkfont.Font(family='Segoe UI', size=9),
+            'small': tkfont.Font(family='Segoe UI', size=8)
+        }
+
         # Contenedor principal
         form_frame = tk.Frame(parent, bg=self.theme.colors['bg_primary'])
         form_frame.pack(fill='both', expand=True, padx=15, pady=10)
@@ -196,7 +225,7 @@ class AutomationTab:
         title_label = tk.Label(
             form_frame,
             text="Seleccionar Estado del Dropdown",
-            font=('Segoe UI', 10, 'bold'),
+            font=fonts['title'],
             fg=self.theme.colors['text_primary'],
             bg=self.theme.colors['bg_primary']
         )
@@ -205,15 +234,12 @@ class AutomationTab:
         desc_label = tk.Label(
             form_frame,
             text="Configura el estado y tipo de despacho para la automatización",
-            font=('Segoe UI', 8),
+            font=fonts['small'],
             fg=self.theme.colors['text_secondary'],
             bg=self.theme.colors['bg_primary']
         )
         desc_label.pack(anchor='w', pady=(0, 15))
 
-        # Variable para radio buttons
-        self.state_var = tk.StringVar(value="PENDIENTE")
-
         # Frame para radio buttons
         radio_frame = tk.Frame(form_frame, bg=self.theme.colors['bg_primary'])
         radio_frame.pack(fill='x', pady=(0, 15))
@@ -224,7 +250,7 @@ class AutomationTab:
             text="⏳ PENDIENTE (102_UDR_FS)",
             variable=self.state_var,
             value="PENDIENTE",
-            font=('Segoe UI', 9),
+            font=fonts['option'],
             fg=self.theme.colors['text_primary'],
             bg=self.theme.colors['bg_primary'],
             selectcolor='#e6f3ff',
@@ -240,7 +266,7 @@ class AutomationTab:
             text="✅ FINALIZADO (102_UDR_FS)",
             variable=self.state_var,
             value="FINALIZADO",
-            font=('Segoe UI', 9),
+            font=fonts['option'],
             fg=self.theme.colors['text_primary'],
             bg=self.theme.colors['bg_primary'],
             selectcolor='#e6f3ff',
@@ -256,7 +282,7 @@ class AutomationTab:
             text="📺 FINALIZADO 67 PLUS (67_PLUS TV)",
             variable=self.state_var,
             value="FINALIZADO_67_PLUS",
-            font=('Segoe UI', 9),
+            font=fonts['option'],
             fg=self.theme.colors['text_primary'],
             bg=self.theme.colors['bg_primary'],
             selectcolor='#e6f3ff',
@@ -274,7 +300,7 @@ class AutomationTab:
         pendiente_button = tk.Button(
             buttons_frame,
             text="📋 Pendiente",
-            font=('Segoe UI', 8),
+            font=fonts['small'],
             fg='white',
             bg='#4a90e2',
             activebackground='#357abd',
@@ -289,7 +315,7 @@ class AutomationTab:
         finalizado_button = tk.Button(
             buttons_frame,
             text="✅ Finalizado",
-            font=('Segoe UI', 8),
+            font=fonts['small'],
             fg='white',
             bg='#4a90e2',
             activebackground='#357abd',
@@ -304,7 +330,7 @@ class AutomationTab:
         finalizado_67_plus_button = tk.Button(
             buttons_frame,
             text="📺 67 Plus",
-            font=('Segoe UI', 8),
+            font=fonts['small'],
             fg='white',
             bg='#4a90e2',
             activebackground='#357abd',
@@ -319,7 +345,7 @@ class AutomationTab:
         clear_state_button = tk.Button(
             buttons_frame,
             text="🗑️ Por Defecto",
-            font=('Segoe UI', 8),
+            font=fonts['small'],
             fg='white',
             bg='#6c757d',
             activebackground='#545b62',
@@ -332,7 +358,6 @@ class AutomationTab:
 
         # Guardar referencias
         self.ui_components.update({
-            'state_var': self.state_var,
             'pendiente_radio': pendiente_radio,
             'finalizado_radio': finalizado_radio,
             'finalizado_67_plus_radio': finalizado_67_plus_radio,
@@ -345,7 +370,8 @@ class AutomationTab:
     def _create_status_section(self, parent):
         """Crea sección de estado usando componentes modulares"""
         section = AutomationUIFactory.create_collapsible_section(
-            parent, "status", "📊 Estado del Sistema", self.theme
+            parent, "status", "📊 Estado del Sistema", self.theme,
+            cache=self.section_cache
         )
         content = section.create(row=3, min_height=150, default_expanded=False)
         section.set_toggle_callback(self._on_section_toggle)
@@ -362,13 +388,16 @@ class AutomationTab:
     def _create_controls_section(self, parent):
         """Crea sección de controles usando componentes modulares"""
         section = AutomationUIFactory.create_collapsible_section(
-            parent, "controls", "🎮 Controles de Automatización", self.theme
+            parent, "controls", "🎮 Controles de Automatización", self.theme,
+            cache=self.section_cache
         )
-        content = section.create(row=4, min_height=180, default_expanded=False)
+        section.create(row=4, min_height=180, default_expanded=False,
+                       builder=self._create_control_panel)
         section.set_toggle_callback(self._on_section_toggle)
         self.section_frames["controls"] = section
 
-        # Crear panel de controles
+    def _create_control_panel(self, content):
+        """Crea el panel de controles (se construye en la primera expansión)"""
         control_panel = AutomationUIFactory.create_control_panel(content, self.theme)
         control_widgets = control_panel.create()
         self.ui_components.update(control_widgets)
@@ -416,10 +445,10 @@ class AutomationTab:
     def _on_section_toggle(self, section_id, is_expanded):
         """Maneja toggle de secciones - solo una expandida a la vez"""
         if is_expanded:
-            # Colapsar otras secciones
-            for sid, section in self.section_frames.items():
-                if sid != section_id and section.is_expanded():
-                    section.collapse()
+            # Colapsar otras secciones en una sola pasada de layout
+            CollapsibleSection.collapse_many(
+                section for sid, section in self.section_frames.items() if sid != section_id
+            )
             self.expanded_section = section_id
         else:
             self.expanded_section = None
@@ -452,11 +481,7 @@ class AutomationTab:
             return
 
         try:
-            log_text = self.ui_components['log_text']
-            log_text.configure(state=tk.NORMAL)
-            log_text.insert(tk.END, formatted_message + "\n")
-            log_text.configure(state=tk.DISABLED)
-            log_text.see(tk.END)
+            self.log_panel.append(formatted_message, level)
         except Exception:
             pass  # Ignorar errores de UI durante cierre
 
@@ -467,10 +492,7 @@ class AutomationTab:
 
         try:
             self.logger.clear()
-            log_text = self.ui_components['log_text']
-            log_text.configure(state=tk.NORMAL)
-            log_text.delete(1.0, tk.END)
-            log_text.configure(state=tk.DISABLED)
+            self.log_panel.clear()
             self.logger.info("Log limpiado")
         except Exception:
             pass